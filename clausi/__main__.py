@@ -1,6 +1,8 @@
 """Allow running clausi as a module: python -m clausi"""
 
+import sys
+
 from clausi.cli import main
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
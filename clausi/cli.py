@@ -8,39 +8,20 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 import re
-import webbrowser
-import http.server
-import socketserver
-import threading
-import urllib.parse
-import secrets
 import time
-import site
 
+# Heavy or command-specific modules (openai, requests, the OAuth callback server, the
+# scanner and payment flow) are imported inside the commands that use them, so --help
+# and the config commands start without loading them
 import click
-import requests
-import yaml
-import openai
-from rich.console import Console
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeRemainingColumn
-from rich.panel import Panel
-from rich.markdown import Markdown
-from dotenv import load_dotenv
-try:
-    import pathspec
-except ImportError:
-    pathspec = None
+from rich.text import Text
 
 # Import our modules
 from clausi import __version__
-from clausi.core import payment as scan_module
 from clausi.utils import config as config_module
-from clausi.core import clause_selector
-from clausi.core import scanner
-from clausi.api import client
 from clausi.utils.console import console
-from clausi.utils.output import ensure_output_dir
+from clausi.utils.output import ensure_output_dir, DOWNLOAD_CHUNK_SIZE
 from clausi.utils import regulations as regs_module
 
 # Constants
@@ -51,16 +32,31 @@ DEFAULT_API_MAX_RETRIES = 3
 # Load regulations dynamically (built-in from backend + custom from local)
 # Uses lazy loading to avoid network requests at CLI startup
 _REGULATIONS_CACHE = None
+# Codes and display names derived from _REGULATIONS_CACHE when it is filled
+_REGULATION_KEYS: tuple = ()
+_REGULATION_NAMES: Dict[str, str] = {}
 
 def get_regulations():
     """Get all available regulations (cached for performance). Lazy loaded."""
-    global _REGULATIONS_CACHE
+    global _REGULATIONS_CACHE, _REGULATION_KEYS, _REGULATION_NAMES
     if _REGULATIONS_CACHE is None:
         built_in, custom = regs_module.get_all_regulations()
         # Merge for backward compatibility with REGULATIONS dict lookups
         _REGULATIONS_CACHE = {**built_in, **{k: {'name': k, 'description': 'Custom regulation'} for k in custom}}
+        _REGULATION_KEYS = tuple(_REGULATIONS_CACHE)
+        _REGULATION_NAMES = {code: info.get('name', code) for code, info in _REGULATIONS_CACHE.items()}
     return _REGULATIONS_CACHE
 
+def _regulation_keys() -> tuple:
+    """Codes of all available regulations."""
+    get_regulations()
+    return _REGULATION_KEYS
+
+def _regulation_name(code: str) -> str:
+    """Display name of a regulation, or the code itself when it is unknown."""
+    get_regulations()
+    return _REGULATION_NAMES.get(code, code)
+
 # Backward compatibility - now lazy via function call
 # Use get_regulations() instead of REGULATIONS directly
 REGULATIONS = {}  # Empty dict, populated lazily when needed
@@ -104,7 +100,12 @@ def create_default_config():
             "api": {
                 "url": DEFAULT_API_URL,
                 "timeout": DEFAULT_API_TIMEOUT,
-                "max_retries": DEFAULT_API_MAX_RETRIES
+                "max_retries": DEFAULT_API_MAX_RETRIES,
+                "compress_requests": False  # Gzip scan uploads (backend must accept Content-Encoding: gzip)
+            },
+            "scan": {
+                "max_file_bytes": 1024 * 1024,  # Larger files are skipped without being read (0 = no limit)
+                "dedupe_files": False  # Send identical files once with "aliases" (backend must support it)
             },
             "report": {
                 "format": "pdf",
@@ -123,8 +124,7 @@ def create_default_config():
         }
 
         try:
-            with open(config_path, 'w') as f:
-                yaml.dump(config, f, default_flow_style=False)
+            config_module._write_yaml_atomic(config_path, config)
             console.print(f"[green]✓[/green] Created default configuration file at [bold]{config_path}[/bold]")
         except Exception as e:
             console.print(f"[red]✗[/red] Error creating config file: {e}")
@@ -156,25 +156,74 @@ def get_clausi_api_key():
 
 # Use config_module.get_openai_key() directly instead of wrapper
 
-def validate_openai_key(key: str) -> bool:
-    """Validate the OpenAI API key by making a test request."""
+# Hashes of OpenAI keys that passed validation, so repeat scans skip the live check
+VALIDATED_KEYS_FILENAME = "validated_keys.json"
+VALIDATED_KEY_TTL = 24 * 3600  # 1 day in seconds
+
+def _validated_keys_path() -> Path:
+    """Path of the validated-keys cache, next to config.yml."""
+    return config_module._ensure_config_dir() / VALIDATED_KEYS_FILENAME
+
+def _load_validated_keys() -> Dict[str, float]:
+    """Load {sha256(key): last validation time}; an unreadable file counts as empty."""
+    try:
+        with open(_validated_keys_path(), 'r') as f:
+            data = json.load(f)
+    except Exception:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+def _save_validated_keys(data: Dict[str, float]) -> None:
+    """Save the validated key hashes; failing to write only costs a re-check next time."""
+    try:
+        config_module._write_atomic(_validated_keys_path(), lambda f: json.dump(data, f))
+    except Exception:
+        pass
+
+def validate_openai_key(key: str, force: bool = False) -> bool:
+    """Validate the OpenAI API key by making a test request.
+
+    A key that passed within VALIDATED_KEY_TTL is trusted without a request unless force is set.
+    Only a SHA-256 hash of the key is stored.
+    """
     if not key or not isinstance(key, str) or len(key.strip()) == 0:
         return False
-    
+
+    import hashlib
+
+    key_hash = hashlib.sha256(key.strip().encode()).hexdigest()
+    validated = _load_validated_keys()
+    now = time.time()
+    if not force and now - validated.get(key_hash, 0) < VALIDATED_KEY_TTL:
+        return True
+
+    import openai
+
     try:
         openai.api_key = key.strip()
         # Make a simple API call to verify the key
         openai.models.list()
-        return True
     except Exception as e:
         console.print(f"[yellow]Warning: OpenAI key validation failed: {str(e)}[/yellow]")
+        validated.pop(key_hash, None)
+        _save_validated_keys(validated)
         return False
 
+    # Drop expired entries while recording this one
+    validated = {h: t for h, t in validated.items() if now - t < VALIDATED_KEY_TTL}
+    validated[key_hash] = now
+    _save_validated_keys(validated)
+    return True
+
 def save_audit_metadata(path: Path, metadata: Dict[str, Any]) -> None:
-    """Save audit metadata to a JSON file."""
+    """Save audit metadata to a JSON file (serialized with orjson when installed)."""
     metadata_path = path / "audit_metadata.json"
-    with open(metadata_path, 'w') as f:
-        json.dump(metadata, f, indent=2)
+    try:
+        import orjson
+    except ImportError:
+        metadata_path.write_text(json.dumps(metadata, indent=2))
+    else:
+        metadata_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
 
 def copy_template_assets(template: str, output_path: Path) -> None:
     """Copy template assets to output directory."""
@@ -184,12 +233,15 @@ def copy_template_assets(template: str, output_path: Path) -> None:
 
 # Helper functions for scan command
 
-def _validate_and_get_api_key(provider: str, model: Optional[str] = None):
+def _validate_and_get_api_key(provider: str, model: Optional[str] = None, force_validate: bool = False,
+                              cfg: Optional[Dict[str, Any]] = None):
     """Validate and return API key based on provider.
 
     Args:
         provider: AI provider ("clausi", "claude", or "openai")
         model: Optional model name
+        force_validate: Re-check the OpenAI key even if it passed validation recently
+        cfg: Already loaded config to read the key from (loaded when omitted)
 
     Returns:
         str or None: API key (None for Clausi hosted AI)
@@ -205,7 +257,7 @@ def _validate_and_get_api_key(provider: str, model: Optional[str] = None):
 
     # Claude provider - requires Anthropic API key
     if provider == "claude":
-        api_key = config_module.get_anthropic_key()
+        api_key = config_module.get_anthropic_key(cfg)
         if not api_key:
             console.print("\n[bold yellow]Anthropic API Key Required[/bold yellow]")
             console.print(f"\nTo use Claude, you need to set up your Anthropic API key:")
@@ -221,7 +273,7 @@ def _validate_and_get_api_key(provider: str, model: Optional[str] = None):
 
     # OpenAI provider - requires OpenAI API key
     elif provider == "openai":
-        api_key = config_module.get_openai_key()
+        api_key = config_module.get_openai_key(cfg)
         if not api_key:
             console.print("\n[bold yellow]OpenAI API Key Required[/bold yellow]")
             console.print("\nTo use OpenAI, you need to set up your OpenAI API key:")
@@ -235,7 +287,7 @@ def _validate_and_get_api_key(provider: str, model: Optional[str] = None):
             sys.exit(1)
 
         # Validate OpenAI key
-        if not validate_openai_key(api_key):
+        if not validate_openai_key(api_key, force=force_validate):
             console.print("\n[bold yellow]Invalid OpenAI API Key[/bold yellow]")
             console.print("\nThe provided OpenAI API key appears to be invalid. Please set a valid key using:")
             console.print("\n[cyan]clausi config set --openai-key your-key-here[/cyan]")
@@ -273,15 +325,18 @@ def launch_interactive_mode():
             console.print(f"[red]Error launching interactive mode: {error_msg}[/red]")
             sys.exit(1)
 
-def _get_scan_regulations(regulation: Optional[tuple]) -> List[str]:
+def _get_scan_regulations(regulation: Optional[tuple], cfg: Dict[str, Any]) -> List[str]:
     """Get list of regulations to scan against.
 
+    Args:
+        regulation: Regulations given on the command line
+        cfg: Loaded config, used when none were given
+
     Returns:
         List[str]: List of regulation codes
     """
     if regulation:
         return list(regulation)
-    cfg = load_config()
     return cfg.get("regulations", {}).get("selected", regs_module.get_regulation_choices())
 
 def _setup_clause_scoping(select_clauses: bool, include_clauses: Optional[tuple],
@@ -292,6 +347,8 @@ def _setup_clause_scoping(select_clauses: bool, include_clauses: Optional[tuple]
     Returns:
         tuple: (clauses_include, clauses_exclude)
     """
+    from clausi.core import clause_selector
+
     clauses_include = None
     clauses_exclude = None
 
@@ -301,7 +358,7 @@ def _setup_clause_scoping(select_clauses: bool, include_clauses: Optional[tuple]
         if not target_reg and len(regulations) > 1:
             console.print(f"\n[yellow]Multiple regulations selected. Choose one for clause scoping:[/yellow]")
             for i, reg in enumerate(regulations, 1):
-                console.print(f"  {i}. {get_regulations().get(reg, {}).get('name', reg)}")
+                console.print(f"  {i}. {_regulation_name(reg)}")
             from rich.prompt import Prompt
             choice = Prompt.ask("[cyan]Select regulation[/cyan]", default="1")
             try:
@@ -332,17 +389,74 @@ def _setup_clause_scoping(select_clauses: bool, include_clauses: Optional[tuple]
 
     return clauses_include, clauses_exclude
 
-def _discover_and_filter_files(abs_path: str, ignore: Optional[tuple]) -> List[dict]:
+def _max_file_bytes(cfg: Dict[str, Any]) -> Optional[int]:
+    """Size limit for scanned files from the scan.max_file_bytes setting; 0 or null means no limit."""
+    from clausi.core import scanner
+
+    return (cfg.get("scan") or {}).get("max_file_bytes", scanner.MAX_FILE_BYTES) or None
+
+def _start_file_discovery(abs_path: str, verbose: bool = False, include_hidden: bool = False,
+                          max_file_bytes: Optional[int] = None):
+    """Start reading the project's source files on a background thread.
+
+    Returns (future, errors, stop): the future resolves to scanner.scan_directory's file list,
+    errors collects unreadable files until _discover_and_filter_files reports them, and stop()
+    cancels the walk and waits for the thread. Call stop() however the scan ends; the TUI runs
+    scans in-process, so a walk left running would keep reading after an early exit.
+    """
+    import threading
+    from concurrent.futures import Future
+    from clausi.core import scanner
+
+    future = Future()
+    errors = []
+    cancel = threading.Event()
+
+    def run():
+        try:
+            future.set_result(scanner.scan_directory(abs_path, verbose=verbose, errors=errors,
+                                                     include_hidden=include_hidden,
+                                                     max_file_bytes=max_file_bytes,
+                                                     cancel=cancel))
+        except BaseException as e:
+            future.set_exception(e)
+
+    thread = threading.Thread(target=run, name="clausi-discovery", daemon=True)
+    thread.start()
+
+    def stop():
+        cancel.set()
+        thread.join()
+
+    return future, errors, stop
+
+def _discover_and_filter_files(abs_path: str, ignore: Optional[tuple], verbose: bool = False,
+                               discovery=None, include_hidden: bool = False,
+                               max_file_bytes: Optional[int] = None, dedupe: bool = False) -> List[dict]:
     """Discover and filter files to analyze.
 
+    Args:
+        discovery: Optional (future, errors, stop) from _start_file_discovery to wait on
+            instead of scanning here
+        include_hidden: Also walk directories whose names start with "."
+        max_file_bytes: Skip files larger than this without reading them (None for no limit)
+        dedupe: Send files with identical content once, with the copies listed as "aliases"
+
     Returns:
         List[dict]: List of file dictionaries
     """
+    from clausi.core import scanner
     from clausi.utils.output import create_enhanced_progress_bar
 
     with create_enhanced_progress_bar("Scanning project files...") as progress:
         task = progress.add_task("Scanning project files...", total=None)
-        files = scanner.scan_directory(abs_path)
+        if discovery is None:
+            files = scanner.scan_directory(abs_path, verbose=verbose, include_hidden=include_hidden,
+                                           max_file_bytes=max_file_bytes)
+        else:
+            future, errors, _ = discovery
+            files = future.result()
+            scanner.report_read_errors(errors, verbose)
         progress.update(task, completed=True)
 
     if not files:
@@ -353,15 +467,50 @@ def _discover_and_filter_files(abs_path: str, ignore: Optional[tuple]) -> List[d
 
     # Filter files based on .clausiignore and command-line ignore patterns
     ignore_list = list(ignore) if ignore else None
-    files = scanner.filter_ignored_files(files, abs_path, ignore_list)
+    files = scanner.filter_ignored_files(files, abs_path, ignore_list, verbose=verbose)
+
+    # Files over the size limit were never read; leave them out of the request
+    too_large = [file_info["path"] for file_info in files if file_info.get("too_large")]
+    if too_large:
+        files = [file_info for file_info in files if not file_info.get("too_large")]
+        if verbose:
+            for rel_path in too_large:
+                console.print(f"[dim]Skipping {rel_path} (larger than {max_file_bytes:,} bytes)[/dim]")
+        console.print(f"[yellow]Skipped {len(too_large)} files larger than {max_file_bytes:,} bytes "
+                      f"(set scan.max_file_bytes to change the limit)[/yellow]")
 
     if not files:
         console.print("[yellow]No files found to analyze after applying ignore patterns![/yellow]")
         sys.exit(1)
 
+    # Identical copies are sent once, with the other paths listed as aliases
+    if dedupe:
+        unique_files = scanner.dedupe_files(files)
+        if len(unique_files) < len(files):
+            console.print(f"Sending {len(files) - len(unique_files)} duplicate files as aliases of identical ones")
+            files = unique_files
+
     console.print(f"Analyzing {len(files)} files after filtering")
     return files
 
+# Stand-in for the file list while the rest of a scan payload is encoded
+_FILES_PLACEHOLDER = "@@clausi-scan-files@@"
+
+def _encode_scan_payload(data: Dict[str, Any], files_json: str, compress: bool = False) -> bytes:
+    """Encode a scan/estimate request body around an already-encoded file list.
+
+    data["metadata"]["files"] must hold _FILES_PLACEHOLDER; it is swapped for files_json so
+    the file contents are only ever JSON-encoded once per scan. With compress=True the body
+    is gzipped and must be sent with "Content-Encoding: gzip".
+    """
+    body = json.dumps(data, allow_nan=False)
+    body = body.replace(json.dumps(_FILES_PLACEHOLDER), files_json, 1).encode("utf-8")
+    if compress:
+        import gzip
+        # Source text compresses well even at a low level, which keeps CPU time small
+        body = gzip.compress(body, compresslevel=3)
+    return body
+
 @click.group(invoke_without_command=True)
 @click.pass_context
 @click.version_option(version=__version__, prog_name="Clausi")
@@ -502,7 +651,8 @@ def show():
     
     # Add regulation settings
     regulations = config.get("regulations", {})
-    selected_regs = regulations.get("selected", list(get_regulations().keys()))
+    # Only fall back to the (possibly fetched) regulation list when nothing is selected
+    selected_regs = regulations["selected"] if "selected" in regulations else list(_regulation_keys())
     table.add_row("Selected Regulations", ", ".join(selected_regs))
     
     console.print(table)
@@ -613,16 +763,36 @@ def list_models():
 @click.option("--open-findings", is_flag=True, help="Auto-open findings.md in default editor after scan")
 @click.option("--show-markdown", is_flag=True, help="Display markdown findings summary in terminal")
 @click.option("--show-cache-stats/--no-cache-stats", default=None, help="Show/hide cache statistics (default: from config)")
+@click.option("--force-validate", is_flag=True, help="Re-check the OpenAI API key even if it was validated in the last 24 hours")
+@click.option("--include-hidden", is_flag=True, help="Also scan directories whose names start with '.'")
 def scan(path: str, regulation: Optional[List[str]], mode: str, output: Optional[str], claude_model: Optional[str],
           openai_model: Optional[str], select_clauses: bool, include_clauses: Optional[List[str]],
           exclude_clauses: Optional[List[str]], preset: Optional[str], format: str, template: Optional[str], verbose: bool,
           skip_confirmation: bool, max_cost: Optional[float], show_details: bool, min_severity: str, ignore: Optional[List[str]],
-          open_findings: bool, show_markdown: bool, show_cache_stats: Optional[bool]):
+          open_findings: bool, show_markdown: bool, show_cache_stats: Optional[bool], force_validate: bool,
+          include_hidden: bool):
     """Run compliance audit on your codebase (main command)."""
+    import requests
+    from clausi.core import payment as scan_module
+
+    # Convert path to absolute path early
+    # This ensures the backend creates output in the correct location
+    abs_path = os.path.abspath(path)
+
+    # Read the config once; every setting below comes from this copy
+    cfg = load_config() or {}
+
+    # Read the project's files in the background; the payment check, key validation and
+    # regulation lookups below are mostly network waits that overlap with the disk reads
+    max_file_bytes = _max_file_bytes(cfg)
+    discovery = _start_file_discovery(abs_path, verbose, include_hidden, max_file_bytes)
+    # Context teardown runs on every way out of scan (return, sys.exit, errors), like a finally
+    click.get_current_context().call_on_close(discovery[2])
+
     # Check payment requirements before estimate (for full mode)
     # This should happen BEFORE API key validation
     if mode == "full":
-        api_url = get_api_url()
+        api_url = get_api_url(cfg)
         if not scan_module.check_payment_required(api_url, mode):
             return  # Exit if payment required
 
@@ -632,22 +802,22 @@ def scan(path: str, regulation: Optional[List[str]], mode: str, output: Optional
         # User specified --claude flag
         provider = "claude"
         # If --claude has a value, it's the model; otherwise use default
-        model = claude_model if claude_model != "" else config_module.get_ai_model("claude")
+        model = claude_model if claude_model != "" else config_module.get_ai_model("claude", cfg)
     elif openai_model is not None:
         # User specified --openai flag
         provider = "openai"
         # If --openai has a value, it's the model; otherwise use default
-        model = openai_model if openai_model != "" else config_module.get_ai_model("openai")
+        model = openai_model if openai_model != "" else config_module.get_ai_model("openai", cfg)
     else:
         # Default: use Clausi hosted AI (pay per scan, $3 minimum, LOC-based)
         provider = "clausi"
         model = None
 
     # Validate and get API key
-    api_key = _validate_and_get_api_key(provider, model)
+    api_key = _validate_and_get_api_key(provider, model, force_validate=force_validate, cfg=cfg)
 
     # Get regulations to scan against
-    regulations = _get_scan_regulations(regulation)
+    regulations = _get_scan_regulations(regulation, cfg)
 
     # Handle clause scoping
     clauses_include, clauses_exclude = _setup_clause_scoping(
@@ -656,27 +826,29 @@ def scan(path: str, regulation: Optional[List[str]], mode: str, output: Optional
 
     # Set default template if not specified
     if not template:
-        config = load_config()
-        template = config.get("report", {}).get("template", "default")
-    
-    # Convert path to absolute path early
-    # This ensures the backend creates output in the correct location
-    abs_path = os.path.abspath(path)
+        template = cfg.get("report", {}).get("template", "default")
 
     # If output not provided, fall back to config
     if not output:
-        cfg = load_config()
-        output = cfg.get("report", {}).get("output_dir", "clausi/reports") if cfg else "clausi/reports"
+        output = cfg.get("report", {}).get("output_dir", "clausi/reports")
     # Create output directory
     output_path = ensure_output_dir(abs_path, output)
 
     # Start scanning
     console.print(f"[bold]Starting compliance scan for {abs_path}[/bold]")
-    reg_names = ", ".join(get_regulations().get(r, {}).get("name", r) for r in regulations)
+    reg_names = ", ".join(map(_regulation_name, regulations))
     console.print(f"Regulations: {reg_names}")
 
-    # Discover and filter files
-    files = _discover_and_filter_files(abs_path, ignore)
+    # Discover and filter files, then encode them once for both the estimate and the scan
+    # request; the list itself (with every file's content) can be freed right away
+    files = _discover_and_filter_files(abs_path, ignore, verbose, discovery=discovery,
+                                       max_file_bytes=max_file_bytes,
+                                       dedupe=bool((cfg.get("scan") or {}).get("dedupe_files", False)))
+    file_count = len(files)
+    files_json = json.dumps(files, allow_nan=False)
+    del files
+    # Gzipped request bodies need backend support, so they are opt-in
+    compress = bool(cfg.get("api", {}).get("compress_requests", False))
 
     # Separate built-in and custom regulations
     custom_regs_data = regs_module.get_custom_regulations_for_scan(regulations)
@@ -695,13 +867,13 @@ def scan(path: str, regulation: Optional[List[str]], mode: str, output: Optional
         "clauses_exclude": clauses_exclude,  # NEW: Clause scoping (exclude list)
         "metadata": {
             "path": abs_path,  # Use absolute path
-            "files": files,
+            "files": _FILES_PLACEHOLDER,  # Replaced by files_json in _encode_scan_payload
             "timestamp": datetime.utcnow().isoformat(),
             "format": format,
             "template": template,
             "company": {
-                "name": load_config().get("report", {}).get("company_name", ""),
-                "logo": load_config().get("report", {}).get("company_logo", "")
+                "name": cfg.get("report", {}).get("company_name", ""),
+                "logo": cfg.get("report", {}).get("company_logo", "")
             }
         },
         "estimate_only": True  # Flag to indicate this is just for estimation
@@ -709,7 +881,7 @@ def scan(path: str, regulation: Optional[List[str]], mode: str, output: Optional
     
     # Get token estimates from backend
     try:
-        api_url = get_api_url()
+        api_url = get_api_url(cfg)
 
         # Construct headers with appropriate API key header based on provider
         headers = {"Content-Type": "application/json"}
@@ -719,10 +891,12 @@ def scan(path: str, regulation: Optional[List[str]], mode: str, output: Optional
                 headers["X-Anthropic-Key"] = api_key
             elif provider == "openai":
                 headers["X-OpenAI-Key"] = api_key
+        if compress:
+            headers["Content-Encoding"] = "gzip"
 
-        response = requests.post(
+        response = config_module.get_http_session().post(
             f"{api_url}/api/clausi/estimate",
-            json=data,
+            data=_encode_scan_payload(data, files_json, compress),
             headers=headers,
             timeout=300
         )
@@ -757,19 +931,23 @@ def scan(path: str, regulation: Optional[List[str]], mode: str, output: Optional
             console.print(f"Estimated Cost: ${estimate['estimated_cost']:.2f}")
 
         # Show per-regulation breakdown (token info - legacy)
-        console.print("\n[bold]Per Regulation:[/bold]")
-        for reg in estimate['regulation_breakdown']:
-            console.print(f"  {get_regulations().get(reg['regulation'], {}).get('name', reg['regulation'])}: {reg['total_tokens']:,} tokens")
+        # Each breakdown is printed with a single console write
+        lines = ["\n[bold]Per Regulation:[/bold]"]
+        lines.extend(
+            f"  {_regulation_name(reg['regulation'])}: {reg['total_tokens']:,} tokens"
+            for reg in estimate['regulation_breakdown']
+        )
+        console.print("\n".join(lines))
 
         # Show per-file breakdown if requested (--show-details)
         if show_details:
-            console.print("\n[bold]Per File:[/bold]")
+            lines = ["\n[bold]Per File:[/bold]"]
             for file in estimate['file_breakdown']:
-                cost_str = f"${file['estimated_cost']:.2f}"
                 if file.get('too_large', False):
-                    console.print(f"  {file['path']}: [red]Too large[/red]")
+                    lines.append(f"  {file['path']}: [red]Too large[/red]")
                 else:
-                    console.print(f"  {file['path']}: {cost_str}")
+                    lines.append(f"  {file['path']}: ${file['estimated_cost']:.2f}")
+            console.print("\n".join(lines))
         
         # Check against max cost if specified
         if max_cost is not None and estimate['estimated_cost'] > max_cost:
@@ -797,7 +975,11 @@ def scan(path: str, regulation: Optional[List[str]], mode: str, output: Optional
 
         try:
             # Use async scan request (with job polling) to prevent timeouts on large scans
-            result = scan_module.make_async_scan_request(get_api_url(), api_key, provider, data)
+            result = scan_module.make_async_scan_request(
+                get_api_url(cfg), api_key, provider, data,
+                body=_encode_scan_payload(data, files_json, compress),
+                body_encoding="gzip" if compress else None
+            )
             if not result:
                 console.print("[red]Scan failed[/red]")
                 sys.exit(1)
@@ -814,19 +996,21 @@ def scan(path: str, regulation: Optional[List[str]], mode: str, output: Optional
                         headers = {}
                         if api_key:
                             headers["Authorization"] = f"Bearer {api_key}"
-                        response = requests.get(
-                            f"{get_api_url()}/api/clausi/report/{report_filename}",
+                        # Streamed straight to disk so a large PDF is never held in memory whole
+                        with config_module.get_http_session().get(
+                            f"{get_api_url(cfg)}/api/clausi/report/{report_filename}",
                             headers=headers,
-                            timeout=60
-                        )
-
-                        if response.status_code == 200:
-                            report_path = output_path / report_filename
-                            with open(report_path, 'wb') as f:
-                                f.write(response.content)
-                            console.print(f"[green]{report_format.upper()} report saved to: {report_path}[/green]")
-                        else:
-                            console.print(f"[red]Failed to download {report_format} report: {response.status_code}[/red]")
+                            timeout=60,
+                            stream=True
+                        ) as response:
+                            if response.status_code == 200:
+                                report_path = output_path / report_filename
+                                with open(report_path, 'wb') as f:
+                                    for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                                        f.write(chunk)
+                                console.print(f"[green]{report_format.upper()} report saved to: {report_path}[/green]")
+                            else:
+                                console.print(f"[red]Failed to download {report_format} report: {response.status_code}[/red]")
                     except Exception as e:
                         console.print(f"[red]Error downloading {report_format} report: {str(e)}[/red]")
             else:
@@ -844,7 +1028,7 @@ def scan(path: str, regulation: Optional[List[str]], mode: str, output: Optional
                 "path": path,
                 "regulations": regulations,
                 "mode": mode,
-                "files_analyzed": len(files),
+                "files_analyzed": file_count,
                 "template": template,
                 "format": format,
                 "ai_provider": provider,  # NEW: Record AI provider used
@@ -865,15 +1049,16 @@ def scan(path: str, regulation: Optional[List[str]], mode: str, output: Optional
                 table.add_column("Location", style="blue")
                 table.add_column("Description", style="white")
 
+                # Backend-provided text goes in as plain Text, so no cell is parsed for markup
+                passed = Text("✓", style="green")
+                failed = Text("✗", style="red")
                 for finding in result["findings"]:
-                    status = "✓" if not finding.get("violation") else "✗"
-                    status_style = "green" if not finding.get("violation") else "red"
                     table.add_row(
-                        finding.get("clause_id", ""),
-                        f"[{status_style}]{status}[/{status_style}]",
-                        finding.get("severity", ""),
-                        finding.get("location", ""),
-                        finding.get("description", "")
+                        Text(str(finding.get("clause_id", ""))),
+                        failed if finding.get("violation") else passed,
+                        Text(str(finding.get("severity", ""))),
+                        Text(str(finding.get("location", ""))),
+                        Text(str(finding.get("description", "")))
                     )
 
                 console.print(table)
@@ -884,7 +1069,6 @@ def scan(path: str, regulation: Optional[List[str]], mode: str, output: Optional
                 console.print(f"\n[bold]Actual Cost:[/bold] ${token_usage.get('cost', 0):.2f}")
 
             # Display cache statistics if available and enabled
-            cfg = load_config()
             # Use command-line flag if provided, otherwise fall back to config
             display_cache = show_cache_stats if show_cache_stats is not None else cfg.get("ui", {}).get("show_cache_stats", True)
 
@@ -914,7 +1098,7 @@ def scan(path: str, regulation: Optional[List[str]], mode: str, output: Optional
             if run_id:
                 console.print("\n[cyan]📄 Markdown reports available...[/cyan]")
                 markdown_files = download_markdown_files(
-                    api_url=get_api_url(),
+                    api_url=get_api_url(cfg),
                     run_id=run_id,
                     output_dir=output_path,
                     api_key=api_key
@@ -927,7 +1111,6 @@ def scan(path: str, regulation: Optional[List[str]], mode: str, output: Optional
                     findings_md = output_path / "findings.md"
 
                     # Display markdown summary if requested or if config says so
-                    cfg = load_config()
                     auto_show = show_markdown or cfg.get("ui", {}).get("show_markdown", False)
 
                     if auto_show and findings_md.exists():
@@ -969,6 +1152,8 @@ def balance():
 @cli.command()
 def setup():
     """Configure API keys and settings (first-time setup)."""
+    from rich.panel import Panel
+
     console.print(Panel.fit(
         "Welcome to Clausi CLI Setup!\n\n"
         "This wizard will help you configure Clausi CLI for first use.",
@@ -988,7 +1173,7 @@ def setup():
     # Get default regulation
     regulation = click.prompt(
         "Choose default regulation",
-        type=click.Choice(list(get_regulations().keys())),
+        type=click.Choice(_regulation_keys()),
         default="EU-AIA"
     )
     
@@ -1020,16 +1205,35 @@ def setup():
         console.print("[green]✓[/green] Setup completed successfully!")
         console.print("\nYou can now use 'clausi scan' to start scanning your projects.")
 
+def _editor_command(editor: str, path: Path, windows: bool = os.name == "nt"):
+    """Command that opens path in editor, run without a shell.
+
+    On POSIX $EDITOR may carry its own arguments (e.g. "code --wait") and is split like a
+    shell would. Windows programs parse their own command line, so there the editor string is
+    passed through as written (quoted install paths included) with the path quoted after it.
+    """
+    import shlex
+
+    if windows:
+        return f'{editor} "{path}"'
+    return [*shlex.split(editor), str(path)]
+
 @config.command()
 def edit():
     """Open the configuration file in your default editor (uses $EDITOR or Notepad)."""
     path = config_module.get_config_path()
     editor = os.getenv("EDITOR") or ("notepad" if os.name == "nt" else "vi")
     console.print(f"Opening config file: [bold]{path}[/bold] with [cyan]{editor}[/cyan]")
+    import subprocess
+
     try:
-        os.system(f"{editor} {path}")
-    except Exception as e:
-        console.print(f"[red]✗[/red] Could not open editor: {e}")
+        subprocess.run(_editor_command(editor, path), check=False)
+    except OSError as e:
+        console.print(f"[red]✗[/red] Could not start editor '{editor}': {e}")
+        console.print(f"[dim]Set $EDITOR or open the file manually: {path}[/dim]")
+    except ValueError as e:
+        # Unbalanced quotes in $EDITOR
+        console.print(f"[red]✗[/red] Could not parse $EDITOR '{editor}': {e}")
 
 @cli.group()
 def ui():
@@ -1301,6 +1505,12 @@ def login(token: Optional[str], port: int):
     """
     from clausi.utils.config import save_api_token, get_api_token
     from clausi.utils.emoji import get as emoji
+    import http.server
+    import secrets
+    import socketserver
+    import threading
+    import urllib.parse
+    import webbrowser
 
     # If token provided directly, save it
     if token:
@@ -1424,28 +1634,46 @@ def login(token: Optional[str], port: int):
         console.print(f"\n\n{emoji('crossmark')} Authentication cancelled")
         sys.exit(1)
 
-def get_api_url() -> str:
-    """Get the API URL, prioritizing CLAUSI_TUNNEL_BASE environment variable."""
+def get_api_url(cfg: Optional[Dict[str, Any]] = None) -> str:
+    """Get the API URL, prioritizing CLAUSI_TUNNEL_BASE environment variable.
+
+    Pass an already loaded config to avoid reading config.yml again.
+    """
     # First check for tunnel base URL
     tunnel_base = os.getenv('CLAUSI_TUNNEL_BASE')
     if tunnel_base:
         return tunnel_base.rstrip('/')
     
     # Then check config file
-    config = load_config()
+    config = load_config() if cfg is None else cfg
     if config and config.get("api", {}).get("url"):
         return config["api"]["url"]
     
     # Fall back to default
     return DEFAULT_API_URL
 
-def main():
-    """Main entry point for the CLI."""
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point for the CLI.
+
+    Args:
+        argv: Arguments to run instead of sys.argv[1:], so commands can be invoked in-process
+
+    Returns:
+        int: Exit code of the command
+    """
     try:
-        cli()
+        # Let Click name the program from sys.argv (e.g. "python -m clausi"); in-process calls have no argv to go by
+        cli.main(args=argv, prog_name="clausi" if argv is not None else None)
+    except SystemExit as e:
+        # Click always finishes with sys.exit; hand its code back instead of exiting
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        console.print(str(e.code))
+        return 1
     except Exception as e:
         console.print(f"[red]Error: {str(e)}[/red]")
-        sys.exit(1)
+        return 1
+    return 0
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -1,6 +1,6 @@
 """Core business logic."""
 
-from clausi.core.scanner import scan_directory, filter_ignored_files
+from clausi.core.scanner import scan_directory, iter_scan_directory, scan_and_analyze, filter_ignored_files
 from clausi.core.payment import check_payment_required, handle_scan_response
 from clausi.core.clause_selector import (
     select_clauses_interactive,
@@ -10,6 +10,8 @@ from clausi.core.clause_selector import (
 
 __all__ = [
     "scan_directory",
+    "iter_scan_directory",
+    "scan_and_analyze",
     "filter_ignored_files",
     "check_payment_required",
     "handle_scan_response",
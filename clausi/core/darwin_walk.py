@@ -0,0 +1,208 @@
+"""Directory walking on macOS using getattrlistbulk(2).
+
+getattrlistbulk returns the name, type and size of many directory entries per
+syscall, replacing a readdir plus one stat per entry. Directories on file
+systems that do not support it fall back to os.scandir.
+
+The walker is opt-in (CLAUSI_DARWIN_BULK=1) until it has been verified on more macOS
+file systems; without it the scanner uses os.fwalk.
+"""
+
+import os
+import sys
+import stat
+import errno
+import struct
+import ctypes
+import functools
+from typing import Iterator, List, Optional, Tuple
+
+# attrlist bitmaps (sys/attr.h)
+ATTR_BIT_MAP_COUNT = 5
+ATTR_CMN_NAME = 0x00000001
+ATTR_CMN_OBJTYPE = 0x00000008
+ATTR_CMN_ERROR = 0x20000000
+ATTR_CMN_RETURNED_ATTRS = 0x80000000
+ATTR_FILE_DATALENGTH = 0x00000200
+
+# Object types (sys/vnode.h)
+VREG = 1
+VDIR = 2
+VLNK = 5
+
+# Size of the buffer handed to each getattrlistbulk call
+BUFFER_SIZE = 64 * 1024
+
+# (name, is_dir, size); size is None when it has to come from fstat (symlinks, scandir fallback)
+Entry = Tuple[str, bool, Optional[int]]
+
+
+class _AttrList(ctypes.Structure):
+    _fields_ = [
+        ("bitmapcount", ctypes.c_ushort),
+        ("reserved", ctypes.c_uint16),
+        ("commonattr", ctypes.c_uint32),
+        ("volattr", ctypes.c_uint32),
+        ("dirattr", ctypes.c_uint32),
+        ("fileattr", ctypes.c_uint32),
+        ("forkattr", ctypes.c_uint32),
+    ]
+
+
+@functools.lru_cache(maxsize=1)
+def _libsystem() -> Optional[ctypes.CDLL]:
+    """Load libSystem with getattrlistbulk bound, or None when unavailable."""
+    if sys.platform != "darwin":
+        return None
+    try:
+        libc = ctypes.CDLL("/usr/lib/libSystem.dylib", use_errno=True)
+        getattrlistbulk = libc.getattrlistbulk
+    except (OSError, AttributeError):
+        return None
+    getattrlistbulk.argtypes = [
+        ctypes.c_int, ctypes.POINTER(_AttrList), ctypes.c_void_p, ctypes.c_size_t, ctypes.c_uint64
+    ]
+    getattrlistbulk.restype = ctypes.c_int
+    return libc
+
+
+def available() -> bool:
+    """Check whether the getattrlistbulk walker is enabled (CLAUSI_DARWIN_BULK=1) and usable."""
+    return os.getenv("CLAUSI_DARWIN_BULK") == "1" and _libsystem() is not None
+
+
+def _list_bulk(top: str, dirfd: int) -> Optional[List[Entry]]:
+    """List a directory with getattrlistbulk; None means the file system does not support it."""
+    libc = _libsystem()
+    attrs = _AttrList(
+        bitmapcount=ATTR_BIT_MAP_COUNT,
+        commonattr=ATTR_CMN_RETURNED_ATTRS | ATTR_CMN_ERROR | ATTR_CMN_NAME | ATTR_CMN_OBJTYPE,
+        fileattr=ATTR_FILE_DATALENGTH,
+    )
+    buffer = ctypes.create_string_buffer(BUFFER_SIZE)
+    entries: List[Entry] = []
+
+    while True:
+        count = libc.getattrlistbulk(dirfd, ctypes.byref(attrs), buffer, BUFFER_SIZE, 0)
+        if count == 0:
+            return entries
+        if count < 0:
+            err = ctypes.get_errno()
+            if err in (errno.ENOTSUP, errno.EINVAL):
+                return None
+            raise OSError(err, os.strerror(err))
+
+        entries.extend(_parse_entries(buffer.raw, count, top, dirfd))
+
+
+def _parse_entries(raw: bytes, count: int, top: str, dirfd: int) -> List[Entry]:
+    """Decode count packed entries from a getattrlistbulk buffer.
+
+    Each entry starts with its length and the attribute_set_t of attributes actually
+    returned; only fields flagged there are present, in attribute bit order.
+    """
+    entries: List[Entry] = []
+    offset = 0
+    for _ in range(count):
+        (length,) = struct.unpack_from("<I", raw, offset)
+        field = offset + 4
+        commonattr, _, _, fileattr, _ = struct.unpack_from("<5I", raw, field)
+        field += 20
+        offset += length
+
+        # ATTR_CMN_ERROR comes straight after the returned attribute set
+        if commonattr & ATTR_CMN_ERROR:
+            (entry_error,) = struct.unpack_from("<I", raw, field)
+            field += 4
+            if entry_error:
+                continue
+
+        if not commonattr & ATTR_CMN_NAME:
+            # Nothing to open the entry by
+            continue
+        # attrreference_t: offset from the reference itself, length includes the NUL
+        name_offset, name_length = struct.unpack_from("<iI", raw, field)
+        name_start = field + name_offset
+        name = os.fsdecode(raw[name_start:name_start + name_length - 1])
+        field += 8
+
+        if commonattr & ATTR_CMN_OBJTYPE:
+            (obj_type,) = struct.unpack_from("<I", raw, field)
+            field += 4
+        else:
+            obj_type = _lstat_type(name, dirfd)
+
+        if obj_type == VDIR:
+            entries.append((name, True, None))
+        elif obj_type == VREG:
+            size = None
+            if fileattr & ATTR_FILE_DATALENGTH:
+                (size,) = struct.unpack_from("<q", raw, field)
+            entries.append((name, False, size))
+        elif obj_type == VLNK and not os.path.isdir(os.path.join(top, name)):
+            # Links to directories are never descended into, as with os.walk
+            entries.append((name, False, None))
+    return entries
+
+
+def _lstat_type(name: str, dirfd: int) -> Optional[int]:
+    """Object type of a directory entry from lstat, for file systems that do not return it."""
+    try:
+        mode = os.stat(name, dir_fd=dirfd, follow_symlinks=False).st_mode
+    except OSError:
+        return None
+    if stat.S_ISDIR(mode):
+        return VDIR
+    if stat.S_ISREG(mode):
+        return VREG
+    if stat.S_ISLNK(mode):
+        return VLNK
+    return None
+
+
+def _list_scandir(path: str) -> List[Entry]:
+    """Fallback listing through os.scandir."""
+    entries: List[Entry] = []
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                is_dir = entry.is_dir()
+                if is_dir and entry.is_symlink():
+                    continue
+            except OSError:
+                is_dir = False
+            entries.append((entry.name, is_dir, None))
+    return entries
+
+
+def darwin_walk(top: str) -> Iterator[Tuple[str, List[str], List[Tuple[str, Optional[int]]], int]]:
+    """Walk a tree top-down like os.fwalk, listing each directory with getattrlistbulk.
+
+    Yields (dirpath, dirnames, files, dirfd) where files are (name, size) pairs. As with
+    os.walk, dirnames can be pruned in place. As with os.fwalk, dirfd is only valid until
+    the next iteration. Directories are visited from an explicit stack, so deep trees
+    do not run into the recursion limit.
+    """
+    stack = [top]
+    while stack:
+        path = stack.pop()
+        try:
+            dirfd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            continue
+
+        try:
+            try:
+                entries = _list_bulk(path, dirfd)
+                if entries is None:
+                    entries = _list_scandir(path)
+            except OSError:
+                continue
+
+            dirs = [name for name, is_dir, _ in entries if is_dir]
+            files = [(name, size) for name, is_dir, size in entries if not is_dir]
+            yield path, dirs, files, dirfd
+        finally:
+            os.close(dirfd)
+
+        stack.extend(os.path.join(path, name) for name in reversed(dirs))
@@ -12,14 +12,14 @@ from rich.panel import Panel
 import click
 
 # Import configuration functions from utils module
-from clausi.utils.config import get_api_token, save_api_token
+from clausi.utils.config import get_api_token, save_api_token, get_http_session
 from clausi.utils.emoji import get as emoji
 from clausi.utils.console import console
 
 def check_payment_required(api_url: str, mode: str = "full") -> bool:
     """Check if payment is required before proceeding with scan."""
     try:
-        response = requests.post(
+        response = get_http_session().post(
             f"{api_url}/api/clausi/check-payment-required",
             headers={"Content-Type": "application/json"},
             json={"mode": mode},
@@ -246,7 +246,7 @@ def retry_scan_with_token(api_url: str, openai_key: str, provider: str, data: Di
         else:  # openai
             headers["X-OpenAI-Key"] = openai_key
 
-        response = requests.post(
+        response = get_http_session().post(
             f"{api_url}/api/clausi/scan",
             json=data,
             headers=headers,
@@ -259,7 +259,9 @@ def retry_scan_with_token(api_url: str, openai_key: str, provider: str, data: Di
         console.print(f"[red]Error retrying scan: {str(e)}[/red]")
         return None
 
-def make_async_scan_request(api_url: str, openai_key: str, provider: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+def make_async_scan_request(api_url: str, openai_key: str, provider: str, data: Dict[str, Any],
+                            body: Optional[bytes] = None,
+                            body_encoding: Optional[str] = None) -> Optional[Dict[str, Any]]:
     """Make async scan request with job polling (prevents timeouts on large scans).
 
     Args:
@@ -267,6 +269,8 @@ def make_async_scan_request(api_url: str, openai_key: str, provider: str, data:
         openai_key: API key (despite the name, can be Anthropic or OpenAI key)
         provider: AI provider ("claude" or "openai")
         data: Request payload
+        body: Optional pre-encoded JSON of data, sent as is instead of re-encoding data
+        body_encoding: Content-Encoding of body (e.g. "gzip"), if it is compressed
 
     Returns:
         Scan result or None on error
@@ -279,6 +283,9 @@ def make_async_scan_request(api_url: str, openai_key: str, provider: str, data:
         # Prepare headers with appropriate API key header based on provider
         headers = {"Content-Type": "application/json"}
 
+        if body is not None and body_encoding:
+            headers["Content-Encoding"] = body_encoding
+
         # Only add API key header if we have one (not using Clausi hosted AI)
         if openai_key:
             if provider == "claude":
@@ -316,9 +323,10 @@ def make_async_scan_request(api_url: str, openai_key: str, provider: str, data:
         console.print(f"{emoji('search')} Starting async scan...")
 
         # Start async scan job
-        response = requests.post(
+        response = get_http_session().post(
             f"{api_url}/api/clausi/scan/async",
-            json=data,
+            json=data if body is None else None,
+            data=body,
             headers=headers,
             timeout=30  # Short timeout for starting job
         )
@@ -367,7 +375,7 @@ def make_async_scan_request(api_url: str, openai_key: str, provider: str, data:
                 poll_headers = {"X-Clausi-Key": token} if token else {}
 
                 try:
-                    status_response = requests.get(
+                    status_response = get_http_session().get(
                         f"{api_url}/api/clausi/jobs/{job_id}/status",
                         headers=poll_headers,
                         timeout=30  # Shorter timeout for status polls
@@ -467,7 +475,7 @@ def make_async_scan_request(api_url: str, openai_key: str, provider: str, data:
         # Get final result
         console.print(f"{emoji('checkmark')} Retrieving scan results...")
         result_headers = {"X-Clausi-Key": token} if token else {}
-        result_response = requests.get(
+        result_response = get_http_session().get(
             f"{api_url}/api/clausi/jobs/{job_id}/result",
             headers=result_headers,
             timeout=60  # Increased timeout for large results
@@ -529,7 +537,7 @@ def make_scan_request(api_url: str, openai_key: str, provider: str, data: Dict[s
 
         console.print(f"{emoji('search')} Scanning for compliance...")
 
-        response = requests.post(
+        response = get_http_session().post(
             f"{api_url}/api/clausi/scan",
             json=data,
             headers=headers,
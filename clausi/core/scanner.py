@@ -1,76 +1,574 @@
 """File scanning and filtering logic."""
 
 import os
+import re
+import mmap
+import sys
+import fnmatch
+import hashlib
+import functools
+import platform
+import threading
+import multiprocessing
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Deque, Optional, Any, Callable, Tuple, Iterator
 
 try:
     import pathspec
 except ImportError:
     pathspec = None
 
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+try:
+    import fcntl
+    import resource
+except ImportError:
+    fcntl = None
+    resource = None
+
 from clausi.utils.console import console
+from clausi.core import darwin_walk
 
 
-def scan_directory(path: str) -> List[Dict[str, str]]:
-    """Scan directory for files to analyze, robustly excluding common junk folders/files and directories."""
-    files_to_analyze = []
-    path = Path(path)
-
-    # File extensions to analyze
-    extensions = {'.py', '.js', '.ts', '.java', '.cpp', '.h', '.hpp', '.c', '.cs', '.go', '.rs', '.swift'}
-
-    # Directories to exclude
-    EXCLUDE_DIRS = {"venv", ".git", "__pycache__", "node_modules", ".mypy_cache", ".pytest_cache"}
-    # File patterns to exclude
-    EXCLUDE_FILES = {".DS_Store", "*.egg-info", "*.pyc", "*.pyo"}
-
-    for root, dirs, files in os.walk(path):
-        # Prune excluded directories
-        dirs[:] = [d for d in dirs if d not in EXCLUDE_DIRS]
-        for file in files:
-            file_path = Path(root) / file
-            # Exclude files by name or pattern
-            if file in EXCLUDE_FILES or any(file_path.match(pattern) for pattern in EXCLUDE_FILES):
-                continue
-            if file_path.suffix in extensions:
+# File extensions to analyze (a tuple so str.endswith can test them in one call)
+SOURCE_EXTENSIONS = ('.py', '.js', '.ts', '.java', '.cpp', '.h', '.hpp', '.c', '.cs', '.go', '.rs', '.swift')
+
+# Directories to exclude (dependencies, VCS data, caches and build output)
+EXCLUDE_DIRS = frozenset({
+    "venv", ".venv", ".git", "__pycache__", "node_modules", ".mypy_cache", ".pytest_cache",
+    ".ruff_cache", ".tox", ".cache", "build", "dist", "target", "coverage",
+    ".idea", ".vscode", ".gradle", ".next", ".nuxt",
+})
+# File patterns to exclude
+EXCLUDE_FILES = frozenset({".DS_Store", "*.egg-info", "*.pyc", "*.pyo"})
+
+
+def _has_wildcard(pattern: str) -> bool:
+    """Check whether a file pattern uses any glob wildcard."""
+    return any(c in pattern for c in "*?[")
+
+
+# Literal names are tested by set membership and "*<literal>" patterns by one str.endswith
+# call; only patterns beyond that go through a precompiled regex
+_EXCLUDE_NAMES = frozenset(p for p in EXCLUDE_FILES if not _has_wildcard(p))
+_EXCLUDE_SUFFIXES = tuple(p[1:] for p in EXCLUDE_FILES if p.startswith("*") and not _has_wildcard(p[1:]))
+_EXCLUDE_GLOBS = [p for p in EXCLUDE_FILES if _has_wildcard(p) and p[1:] not in _EXCLUDE_SUFFIXES]
+_EXCLUDE_RE = re.compile("|".join(fnmatch.translate(p) for p in _EXCLUDE_GLOBS)) if _EXCLUDE_GLOBS else None
+
+# Maximum number of statx submissions queued per io_uring_submit call
+IO_URING_BATCH_SIZE = 16384
+
+# Open-file soft limit requested before the first scan (capped by the hard limit)
+NOFILE_TARGET = 4096
+
+# Set once _raise_nofile_limit has run in this process
+_NOFILE_RAISED = False
+
+
+def _raise_nofile_limit() -> None:
+    """Raise RLIMIT_NOFILE towards NOFILE_TARGET and grow the fd table once up front.
+
+    Duplicating a descriptor near the new limit makes the kernel size the fd table now
+    rather than reallocating it while many files are being opened in parallel. Runs once
+    per process, on the first scan rather than at import, so importing clausi leaves the
+    process limits alone.
+    """
+    global _NOFILE_RAISED
+    if _NOFILE_RAISED:
+        return
+    _NOFILE_RAISED = True
+    if resource is None:
+        return
+    try:
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        target = NOFILE_TARGET if hard == resource.RLIM_INFINITY else min(NOFILE_TARGET, hard)
+        if soft != resource.RLIM_INFINITY and soft < target:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+        else:
+            target = min(soft, NOFILE_TARGET)
+
+        # F_DUPFD picks the lowest free fd >= target - 1, so no open descriptor is clobbered;
+        # both descriptors are closed again once the table has grown
+        fd = os.open(os.devnull, os.O_RDONLY)
+        try:
+            os.close(fcntl.fcntl(fd, fcntl.F_DUPFD, target - 1))
+        finally:
+            os.close(fd)
+    except (OSError, ValueError):
+        pass
+
+
+def _io_uring_enabled() -> bool:
+    """Check whether the opt-in io_uring stat backend can be used (CLAUSI_IO_URING=1, Linux 6.1+)."""
+    if liburing is None or os.getenv("CLAUSI_IO_URING") != "1" or not sys.platform.startswith("linux"):
+        return False
+    try:
+        major, minor = (int(part) for part in platform.release().split(".")[:2])
+    except ValueError:
+        return False
+    return (major, minor) >= (6, 1)
+
+
+def _batch_stat_sizes(paths: List[str]) -> Dict[str, int]:
+    """Stat files through io_uring in batches of statx SQEs.
+
+    Returns a mapping of path to size. Paths that could not be stat'ed are left out so
+    callers fall back to os.path.getsize.
+    """
+    sizes: Dict[str, int] = {}
+    if not paths:
+        return sizes
+
+    ring = liburing.io_uring()
+    cqe = liburing.io_uring_cqe()
+    try:
+        liburing.io_uring_queue_init(min(len(paths), IO_URING_BATCH_SIZE), ring, 0)
+    except Exception:
+        return sizes
+
+    try:
+        for start in range(0, len(paths), IO_URING_BATCH_SIZE):
+            batch = paths[start:start + IO_URING_BATCH_SIZE]
+            buffers = [liburing.statx() for _ in batch]
+            for index, (file_path, buffer) in enumerate(zip(batch, buffers)):
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_statx(sqe, buffer, os.fsencode(file_path), 0, liburing.STATX_SIZE)
+                sqe.user_data = index
+            liburing.io_uring_submit(ring)
+
+            for _ in batch:
+                liburing.io_uring_wait_cqe(ring, cqe)
+                index, result = cqe.user_data, cqe.res
+                liburing.io_uring_cqe_seen(ring, cqe)
+                if result >= 0:
+                    sizes[batch[index]] = buffers[index].stx_size
+    except Exception:
+        # Partial results are fine; the rest are stat'ed the regular way
+        pass
+    finally:
+        liburing.io_uring_queue_exit(ring)
+
+    return sizes
+
+
+# Size of the per-file trigram Bloom filter and number of probes per trigram
+BLOOM_BITS = 2048
+BLOOM_HASHES = 3
+
+
+def _trigram_positions(trigram: bytes) -> List[int]:
+    """Bit positions for a trigram using double hashing (h1 + i*h2 mod m)."""
+    value = int.from_bytes(trigram, "little")
+    h1 = (value * 0x9E3779B1) & 0xFFFFFFFF
+    h2 = ((value * 0x85EBCA77) & 0xFFFFFFFF) | 1
+    return [(h1 + i * h2) % BLOOM_BITS for i in range(BLOOM_HASHES)]
+
+
+def build_trigram_bloom(content: str) -> bytes:
+    """Build a Bloom filter over all byte trigrams of content."""
+    data = content.encode("utf-8")
+    bits = bytearray(BLOOM_BITS // 8)
+    for trigram in {data[i:i + 3] for i in range(len(data) - 2)}:
+        for position in _trigram_positions(trigram):
+            bits[position >> 3] |= 1 << (position & 7)
+    return bytes(bits)
+
+
+def bloom_may_contain(bloom: bytes, needle: str) -> bool:
+    """Check whether a file whose Bloom filter is bloom may contain needle.
+
+    False means the needle is definitely absent, so the full matcher can be skipped.
+    Needles shorter than a trigram cannot be ruled out.
+    """
+    data = needle.encode("utf-8")
+    for i in range(len(data) - 2):
+        for position in _trigram_positions(data[i:i + 3]):
+            if not bloom[position >> 3] & (1 << (position & 7)):
+                return False
+    return True
+
+
+# Files larger than this are memory-mapped and decoded in place instead of read through a buffer
+MMAP_THRESHOLD = 64 * 1024
+
+# Access hint for mapped files (mmap.madvise is Unix-only, Python 3.8+)
+_MADV_SEQUENTIAL = getattr(mmap, "MADV_SEQUENTIAL", None) if hasattr(mmap.mmap, "madvise") else None
+
+# Default size above which files are not read at all (usually minified or generated code)
+MAX_FILE_BYTES = 1024 * 1024
+
+# Threads reading file contents during a scan, and how many reads may be queued ahead
+READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+READ_AHEAD = READ_WORKERS * 2
+
+# Binary mode keeps Windows from translating newlines below the text layer
+_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+
+
+def _is_excluded_dir(name: str, include_hidden: bool = False) -> bool:
+    """Check whether the walk should skip a directory; hidden ones are skipped unless include_hidden."""
+    return name in EXCLUDE_DIRS or (not include_hidden and name.startswith("."))
+
+
+def _is_source_file(name: str) -> bool:
+    """Check a bare file name against the analyzed extensions and excluded patterns."""
+    # Cheap extension check before anything else; like Path.suffix, a name that is only
+    # the extension (".py") has none
+    if not name.endswith(SOURCE_EXTENSIONS) or name.rfind('.') == 0:
+        return False
+    if name in _EXCLUDE_NAMES or name.endswith(_EXCLUDE_SUFFIXES):
+        return False
+    return _EXCLUDE_RE is None or not _EXCLUDE_RE.match(name)
+
+
+def _read_fd(fd: int, size: Optional[int] = None, max_bytes: Optional[int] = None) -> Tuple[Optional[str], int]:
+    """Read an open file descriptor as UTF-8 text and close it.
+
+    Large files are memory-mapped to avoid an extra bytes copy. Returns (content, size);
+    content is None, without anything being read, when size exceeds max_bytes.
+    """
+    if size is None:
+        try:
+            size = os.fstat(fd).st_size
+        except OSError:
+            os.close(fd)
+            raise
+
+    if max_bytes is not None and size > max_bytes:
+        os.close(fd)
+        return None, size
+
+    if size <= MMAP_THRESHOLD:
+        with os.fdopen(fd, 'r', encoding='utf-8') as f:
+            return f.read(), size
+
+    try:
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+            if _MADV_SEQUENTIAL is not None:
+                # One front-to-back pass: let the kernel read ahead aggressively
+                mm.madvise(_MADV_SEQUENTIAL)
+            content = str(mm, 'utf-8')
+    finally:
+        os.close(fd)
+    # Match the universal newline translation of text-mode reads
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content, size
+
+
+def _cancelled(cancel: Optional[threading.Event]) -> bool:
+    """Check whether a walk has been asked to stop."""
+    return cancel is not None and cancel.is_set()
+
+
+def _iter_opened_sources(root_path: str, errors: List[Tuple[str, str]], include_hidden: bool = False,
+                         cancel: Optional[threading.Event] = None) -> Iterator[Tuple[str, str, int, Optional[int]]]:
+    """Yield (full_path, name, fd, size) for every source file under root_path, opened for reading.
+
+    The caller owns each fd. size is None when it has to come from fstat. Files that cannot
+    be opened are appended to errors as (full_path, message). Hidden directories are only
+    walked with include_hidden=True. The walk stops at the next directory once cancel is set.
+    """
+    if darwin_walk.available():
+        # macOS with CLAUSI_DARWIN_BULK=1: getattrlistbulk lists names, types and sizes in bulk, so files need no fstat
+        for root, dirs, files, dirfd in darwin_walk.darwin_walk(root_path):
+            if _cancelled(cancel):
+                return
+            # Prune excluded directories
+            dirs[:] = [d for d in dirs if not _is_excluded_dir(d, include_hidden)]
+            for file, size in files:
+                if not _is_source_file(file):
+                    continue
+                full_path = os.path.join(root, file)
+                try:
+                    fd = os.open(file, _OPEN_FLAGS, dir_fd=dirfd)
+                except OSError as e:
+                    errors.append((full_path, str(e)))
+                    continue
+                yield full_path, file, fd, size
+        return
+
+    if hasattr(os, "fwalk") and not _io_uring_enabled():
+        # POSIX: open each file relative to its directory fd (openat) to skip path lookups
+        for root, dirs, files, dirfd in os.fwalk(root_path):
+            if _cancelled(cancel):
+                return
+            # Prune excluded directories
+            dirs[:] = [d for d in dirs if not _is_excluded_dir(d, include_hidden)]
+            for file in files:
+                if not _is_source_file(file):
+                    continue
+                full_path = os.path.join(root, file)
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    files_to_analyze.append({
-                        "path": str(file_path.relative_to(path)),
-                        "content": content,
-                        "type": file_path.suffix[1:],  # Remove the dot
-                        "size": os.path.getsize(file_path)
-                    })
-                except Exception as e:
-                    console.print(f"[yellow]Warning: Could not read {file_path}: {e}[/yellow]")
-    return files_to_analyze
+                    fd = os.open(file, _OPEN_FLAGS, dir_fd=dirfd)
+                except OSError as e:
+                    errors.append((full_path, str(e)))
+                    continue
+                yield full_path, file, fd, None
+        return
+
+    candidates = list(_scandir_candidates(root_path, include_hidden, cancel))
+
+    # Optionally stat all candidates in batches through io_uring
+    if _io_uring_enabled():
+        sizes = _batch_stat_sizes([full_path for full_path, _, _ in candidates])
+        candidates = [(full_path, file, sizes.get(full_path)) for full_path, file, _ in candidates]
+
+    for full_path, file, size in candidates:
+        if _cancelled(cancel):
+            return
+        try:
+            fd = os.open(full_path, _OPEN_FLAGS)
+        except OSError as e:
+            errors.append((full_path, str(e)))
+            continue
+        yield full_path, file, fd, size
+
+
+def _iter_sources(root_path: str, errors: List[Tuple[str, str]], include_hidden: bool = False,
+                  max_bytes: Optional[int] = None,
+                  cancel: Optional[threading.Event] = None) -> Iterator[Tuple[str, str, Optional[str], int]]:
+    """Yield (full_path, name, content, size) for every source file under root_path, in walk order.
+
+    Files are opened by the walker and read on a thread pool, at most READ_AHEAD at a time,
+    so reads overlap without holding the whole tree in memory. Files that cannot be read
+    are appended to errors as (full_path, message). Files larger than max_bytes are not
+    read and come back with content None.
+    """
+    pending: Deque[Tuple[str, str, Future]] = deque()
+
+    def collect() -> Optional[Tuple[str, str, Optional[str], int]]:
+        full_path, file, future = pending.popleft()
+        try:
+            content, size = future.result()
+        except Exception as e:
+            errors.append((full_path, str(e)))
+            return None
+        return full_path, file, content, size
+
+    # Leaving the block waits for in-flight reads, which close their fds even if the caller stopped early
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as pool:
+        for full_path, file, fd, size in _iter_opened_sources(root_path, errors, include_hidden, cancel):
+            pending.append((full_path, file, pool.submit(_read_fd, fd, size, max_bytes)))
+            if len(pending) >= READ_AHEAD:
+                source = collect()
+                if source:
+                    yield source
+
+        while pending:
+            source = collect()
+            if source:
+                yield source
+
+
+def _scandir_candidates(root_path: str, include_hidden: bool = False,
+                        cancel: Optional[threading.Event] = None) -> Iterator[Tuple[str, str, Optional[int]]]:
+    """Walk root_path top-down with os.scandir, yielding (full_path, name, size) for source files.
+
+    Visits directories in the same order as os.walk and, like it, does not descend into
+    symlinked directories. On Windows the size comes from the cached DirEntry.stat() data
+    of the directory listing; elsewhere that would cost a stat call, so size is None and
+    is taken from fstat after the file is opened.
+    """
+    sizes_from_listing = os.name == "nt"
+    stack = [root_path]
+    while stack and not _cancelled(cancel):
+        top = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(top) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        # Prune excluded directories
+                        if not _is_excluded_dir(entry.name, include_hidden) and not entry.is_symlink():
+                            subdirs.append(entry.path)
+                        continue
+                    if not _is_source_file(entry.name):
+                        continue
+                    size = None
+                    if sizes_from_listing:
+                        try:
+                            size = entry.stat().st_size
+                        except OSError:
+                            pass
+                    yield entry.path, entry.name, size
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
+
+def report_read_errors(errors: List[Tuple[str, str]], verbose: bool) -> None:
+    """Print one summary line for unreadable files; with verbose=True list every file."""
+    if not errors:
+        return
+    if verbose:
+        for full_path, message in errors:
+            console.print(f"[yellow]Warning: Could not read {full_path}: {message}[/yellow]")
+    full_path, message = errors[0]
+    console.print(f"[yellow]Warning: {len(errors)} files unreadable (first: {full_path}: {message})[/yellow]")
+
+
+def iter_scan_directory(path: str, with_bloom: bool = False, verbose: bool = False,
+                        errors: Optional[List[Tuple[str, str]]] = None,
+                        include_hidden: bool = False,
+                        max_file_bytes: Optional[int] = MAX_FILE_BYTES,
+                        cancel: Optional[threading.Event] = None) -> Iterator[Dict[str, Any]]:
+    """Yield files to analyze one at a time so callers can release each file's content.
+
+    With with_bloom=True each entry also carries a "bloom" trigram filter (bytes) for
+    bloom_may_contain. It is off by default because the entries are sent to the backend as JSON.
+    Unreadable files are summarized once the walk finishes; verbose=True lists each of them.
+    When an errors list is passed, (path, message) pairs are appended to it instead, for the
+    caller to show later with report_read_errors (e.g. when scanning in a background thread).
+    Directories whose names start with "." are skipped unless include_hidden=True.
+    Files larger than max_file_bytes (None for no limit) are not read; they are yielded as
+    stubs with empty content and "too_large": True.
+    Setting cancel stops the walk early (in-flight reads still finish); the files found so far
+    are all that is yielded.
+    """
+    # Resolve symlinks first: fwalk does not descend into a root that is itself a symlink
+    # (e.g. /tmp and /var on macOS)
+    root_path = os.path.realpath(os.fspath(path))
+    _raise_nofile_limit()
+    # Every walked path starts with this prefix, so relative paths are a plain slice
+    prefix_len = len(os.path.join(root_path, ""))
+    report = errors is None
+    if errors is None:
+        errors = []
+
+    sources = _iter_sources(root_path, errors, include_hidden, max_file_bytes, cancel)
+    for full_path, file, content, size in sources:
+        if _cancelled(cancel):
+            # Closing the generator waits for the reads already queued
+            sources.close()
+            return
+        if content is None:
+            yield {
+                "path": full_path[prefix_len:],
+                "content": "",
+                "type": file.rpartition('.')[2],
+                "size": size,
+                "too_large": True
+            }
+            continue
+        file_info = {
+            "path": full_path[prefix_len:],
+            "content": content,
+            "type": file.rpartition('.')[2],
+            "size": size
+        }
+        if with_bloom:
+            file_info["bloom"] = build_trigram_bloom(content)
+        yield file_info
+
+    if report:
+        report_read_errors(errors, verbose)
+
+
+def scan_directory(path: str, with_bloom: bool = False, verbose: bool = False,
+                   errors: Optional[List[Tuple[str, str]]] = None,
+                   include_hidden: bool = False,
+                   max_file_bytes: Optional[int] = MAX_FILE_BYTES,
+                   cancel: Optional[threading.Event] = None) -> List[Dict[str, str]]:
+    """Scan directory for files to analyze, robustly excluding common junk folders/files and directories."""
+    return list(iter_scan_directory(path, with_bloom=with_bloom, verbose=verbose, errors=errors,
+                                    include_hidden=include_hidden, max_file_bytes=max_file_bytes,
+                                    cancel=cancel))
 
 
-def find_clausiignore_file(project_path: str) -> Optional[Path]:
-    """Find .clausiignore file by searching upward from project root."""
-    if pathspec is None:
-        console.print("[yellow]Warning: pathspec library not available. .clausiignore functionality disabled.[/yellow]")
-        return None
+def scan_and_analyze(path: str, analyze_fn: Callable[[str], Any], procs: Optional[int] = None,
+                     include_hidden: bool = False) -> List[Any]:
+    """Run analyze_fn over every source file under path across worker processes.
 
-    current_path = Path(project_path).resolve()
+    The parent only walks the tree (same pruning as scan_directory) and never reads a file;
+    workers receive absolute paths and do the only read themselves, so just short strings
+    are pickled. Results come back in completion order. analyze_fn must be a picklable
+    top-level function.
+    """
+    root = os.path.realpath(os.fspath(path))
+    _raise_nofile_limit()
+    file_paths = [full_path for full_path, _, _ in _scandir_candidates(root, include_hidden)]
+    if not file_paths:
+        return []
 
-    # Search upward from project root
-    while current_path != current_path.parent:
-        clausiignore_path = current_path / ".clausiignore"
-        if clausiignore_path.exists():
-            return clausiignore_path
-        current_path = current_path.parent
+    procs = procs or os.cpu_count() or 1
+    chunksize = max(1, len(file_paths) // (4 * procs))
 
-    return None
+    with multiprocessing.Pool(procs) as pool:
+        return list(pool.imap_unordered(analyze_fn, file_paths, chunksize=chunksize))
 
 
-def parse_clausiignore_file(clausiignore_path: Path) -> Optional[Any]:
-    """Parse .clausiignore file and return a PathSpec object."""
+# Resolved project path -> (.clausiignore location found or None, (directory, st_mtime_ns) for
+# every directory the search looked in)
+_CLAUSIIGNORE_LOOKUP_CACHE: Dict[str, Tuple[Optional[str], Tuple[Tuple[str, int], ...]]] = {}
+
+# Files or directories that mark a project root; the upward search stops there
+PROJECT_ROOT_MARKERS = ('.git', 'pyproject.toml')
+
+
+def find_clausiignore_file(project_path: str) -> Optional[Path]:
+    """Find .clausiignore file by searching upward from project root.
+
+    The search ends at the first directory containing a project root marker (.git or pyproject.toml).
+    """
     if pathspec is None:
+        console.print("[yellow]Warning: pathspec library not available. .clausiignore functionality disabled.[/yellow]")
         return None
 
+    # Work on plain strings; pathlib is only used for the returned value
+    current_path = os.path.realpath(os.fspath(project_path))
+    cache_key = current_path
+
+    # Reuse the previous lookup while none of the searched directories has changed; creating
+    # or removing a .clausiignore (or a root marker) updates its directory's mtime
+    cached = _CLAUSIIGNORE_LOOKUP_CACHE.get(cache_key)
+    if cached is not None:
+        cached_file, searched = cached
+        if all(_dir_mtime_ns(directory) == mtime_ns for directory, mtime_ns in searched):
+            return Path(cached_file) if cached_file else None
+
+    clausiignore_file = None
+    searched_dirs = []
+
+    # Search upward from project root, stopping at the first directory that looks like a project root
+    while True:
+        searched_dirs.append((current_path, _dir_mtime_ns(current_path)))
+        clausiignore_path = os.path.join(current_path, ".clausiignore")
+        if os.path.lexists(clausiignore_path):
+            clausiignore_file = clausiignore_path
+            break
+        if any(os.path.lexists(os.path.join(current_path, marker)) for marker in PROJECT_ROOT_MARKERS):
+            break
+        parent_path = os.path.dirname(current_path)
+        if parent_path == current_path:
+            break
+        current_path = parent_path
+
+    _CLAUSIIGNORE_LOOKUP_CACHE[cache_key] = (clausiignore_file, tuple(searched_dirs))
+    return Path(clausiignore_file) if clausiignore_file else None
+
+
+def _dir_mtime_ns(path: str) -> int:
+    """Modification time of a directory, or -1 when it cannot be stat'ed."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+
+@functools.lru_cache(maxsize=32)
+def _load_spec(clausiignore_path: str, mtime_ns: int) -> Optional[Any]:
+    """Read and compile a .clausiignore file; mtime_ns keys the cache so edits are picked up."""
     try:
         with open(clausiignore_path, 'r', encoding='utf-8') as f:
             patterns = f.readlines()
@@ -87,13 +585,69 @@ def parse_clausiignore_file(clausiignore_path: Path) -> Optional[Any]:
         return None
 
 
-def filter_ignored_files(files: List[Dict[str, str]], project_path: str, ignore_patterns: Optional[List[str]] = None) -> List[Dict[str, str]]:
-    """Filter out files that match ignore patterns."""
+def parse_clausiignore_file(clausiignore_path: Path) -> Optional[Any]:
+    """Parse .clausiignore file and return a PathSpec object."""
+    if pathspec is None:
+        return None
+
+    try:
+        mtime_ns = os.stat(clausiignore_path).st_mtime_ns
+    except OSError as e:
+        console.print(f"[yellow]Warning: Could not parse .clausiignore file: {e}[/yellow]")
+        return None
+
+    return _load_spec(os.fspath(clausiignore_path), mtime_ns)
+
+
+def _literal_prefixes(spec: Any) -> Optional[Tuple[str, ...]]:
+    """Collect the literal (wildcard-free) leading part of every pattern in a PathSpec.
+
+    Mirrors git's nowildcard_len pathspec optimization. Returns None when any pattern can
+    match anywhere in the tree (unanchored, negated, escaped or starting with a wildcard),
+    in which case every path has to go through the full matcher.
+    """
+    prefixes = []
+    for pattern in spec.patterns:
+        if pattern.include is None:
+            continue
+        raw = getattr(pattern, "pattern", None)
+        if not pattern.include or not isinstance(raw, str) or "\\" in raw:
+            return None
+        raw = raw.strip()
+        # Only patterns with a leading or inner slash are anchored to the project root
+        if "/" not in raw.rstrip("/"):
+            return None
+        body = raw.lstrip("/")
+        nowildcard_len = next((i for i, c in enumerate(body) if c in "*?["), len(body))
+        if nowildcard_len == 0:
+            return None
+        prefixes.append(body[:nowildcard_len])
+    return tuple(prefixes) or None
+
+
+def _match_paths(spec: Any, rel_paths: List[str]) -> set:
+    """Return the subset of rel_paths matched by spec, skipping paths outside every literal prefix."""
+    prefixes = _literal_prefixes(spec)
+    if prefixes is None:
+        candidates = rel_paths
+    elif os.sep == "/":
+        candidates = [p for p in rel_paths if p.startswith(prefixes)]
+    else:
+        candidates = [p for p in rel_paths if p.replace(os.sep, "/").startswith(prefixes)]
+    return set(spec.match_files(candidates))
+
+
+def filter_ignored_files(files: List[Dict[str, str]], project_path: str, ignore_patterns: Optional[List[str]] = None,
+                         verbose: bool = False) -> List[Dict[str, str]]:
+    """Filter out files that match ignore patterns.
+
+    Prints one summary line; with verbose=True every ignored file is listed as well.
+    """
     if not files:
         return files
 
     # Find .clausiignore file
-    clausiignore_path = find_clausiignore_file(project_path)
+    clausiignore_path = find_clausiignore_file(os.fspath(project_path))
     ignore_spec = None
 
     if clausiignore_path:
@@ -114,29 +668,52 @@ def filter_ignored_files(files: List[Dict[str, str]], project_path: str, ignore_
     if not ignore_spec and not cmd_ignore_spec:
         return files
 
-    project_path_obj = Path(project_path).resolve()
-    filtered_files = []
-
-    for file_info in files:
-        file_path = Path(file_info["path"])
-        full_path = project_path_obj / file_path
-
-        # Check if file should be ignored
-        should_ignore = False
-
-        if ignore_spec and ignore_spec.match_file(str(file_path)):
-            should_ignore = True
-            console.print(f"[dim]Ignoring {file_path} (matches .clausiignore)[/dim]")
+    # Match all relative paths in one batch per spec instead of per-file calls
+    rel_paths = [file_info["path"] for file_info in files]
+    matched_clausi = _match_paths(ignore_spec, rel_paths) if ignore_spec else set()
+    matched_cmd = _match_paths(cmd_ignore_spec, rel_paths) if cmd_ignore_spec else set()
 
-        if cmd_ignore_spec and cmd_ignore_spec.match_file(str(file_path)):
-            should_ignore = True
-            console.print(f"[dim]Ignoring {file_path} (matches command-line pattern)[/dim]")
+    if verbose:
+        for rel_path in rel_paths:
+            if rel_path in matched_clausi:
+                console.print(f"[dim]Ignoring {rel_path} (matches .clausiignore)[/dim]")
+            if rel_path in matched_cmd:
+                console.print(f"[dim]Ignoring {rel_path} (matches command-line pattern)[/dim]")
 
-        if not should_ignore:
-            filtered_files.append(file_info)
+    matched = matched_clausi | matched_cmd
+    filtered_files = [file_info for file_info, rel_path in zip(files, rel_paths) if rel_path not in matched]
 
     ignored_count = len(files) - len(filtered_files)
     if ignored_count > 0:
-        console.print(f"[green]Ignored {ignored_count} files based on .clausiignore patterns[/green]")
+        console.print(
+            f"[green]Ignored {ignored_count} files "
+            f"({len(matched_clausi)} .clausiignore, {len(matched_cmd)} --ignore)[/green]"
+        )
 
     return filtered_files
+
+
+
+def dedupe_files(files: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Collapse files with identical content into one entry each.
+
+    The first file (in walk order) is kept and the relative paths of its copies are listed
+    under "aliases"; files without copies are returned unchanged. Content is compared by a
+    128-bit BLAKE2b digest.
+    """
+    # Digest -> index of the kept entry in unique
+    first_index: Dict[bytes, int] = {}
+    unique: List[Dict[str, Any]] = []
+    for file_info in files:
+        digest = hashlib.blake2b(file_info["content"].encode("utf-8"), digest_size=16).digest()
+        index = first_index.get(digest)
+        if index is None:
+            first_index[digest] = len(unique)
+            unique.append(file_info)
+            continue
+        first = unique[index]
+        if "aliases" not in first:
+            # Copy so the caller's entry is left as it was
+            first = unique[index] = {**first, "aliases": []}
+        first["aliases"].append(file_info["path"])
+    return unique
@@ -1,5 +1,12 @@
 """Textual UI (TUI) module for interactive mode."""
 
-from clausi.tui.app import ClausUI
-
 __all__ = ["ClausUI"]
+
+
+def __getattr__(name):
+    # Textual is only imported when the app is actually requested, so the
+    # questionary-based interactive menu starts without it
+    if name == "ClausUI":
+        from clausi.tui.app import ClausUI
+        return ClausUI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
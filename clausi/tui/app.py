@@ -60,6 +60,21 @@ class ClausUI(App):
     TITLE = "Clausi CLI v1.0.0"
     SUB_TITLE = "AI Compliance Auditing"
 
+    def __init__(self, mode: str = "main") -> None:
+        """
+        Create the application.
+
+        Args:
+            mode: Which screen to show first ("main", "config", "scan")
+        """
+        super().__init__()
+        self._initial_mode = mode
+
+    def on_mount(self) -> None:
+        """Open the requested screen once the app is running."""
+        if self._initial_mode == "config":
+            self.push_screen(ConfigScreen())
+
     def compose(self) -> ComposeResult:
         """Compose the main UI."""
         yield Header()
@@ -118,10 +133,5 @@ def run_tui(mode: str = "main") -> None:
     Args:
         mode: Which screen to show ("main", "config", "scan")
     """
-    app = ClausUI()
-
-    if mode == "config":
-        # Go directly to config screen
-        app.push_screen(ConfigScreen())
-
+    app = ClausUI(mode=mode)
     app.run()
@@ -1,18 +1,21 @@
 """Simple interactive mode for Clausi CLI - numbered menu like Claude Code planning."""
 
 import os
+import re
 import sys
+import time
+import shlex
+import shutil
+import threading
+import functools
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from rich.console import Console
 from rich.prompt import Prompt, Confirm
 import questionary
 from questionary import Style
-import yaml
-
-# Import regulations utilities
-from clausi.utils import regulations as regs_module
-
-console = Console()
+console = Console(highlight=False)
 
 # Template for new custom regulations
 CUSTOM_REGULATION_TEMPLATE = '''name: "{name}"
@@ -37,40 +40,223 @@ clauses:
 '''
 
 
+
+# Regulation names become codes: spaces/underscores turn into dashes, other punctuation is dropped
+_REG_CODE_SEPARATORS = str.maketrans({' ': '-', '_': '-'})
+_REG_CODE_INVALID = re.compile(r'[^\w-]+')
+
+
+# Choice values for the non-regulation entries of the regulation picker
+_CREATE_REGULATION = "__CREATE__"
+_MULTIPLE_REGULATIONS = "__MULTI__"
+
+
+# Display names for built-in regulations in the regulation pickers
+_FRIENDLY = {
+    "EU-AIA": "EU AI Act (EU-AIA)",
+    "GDPR": "GDPR",
+    "ISO-42001": "ISO 42001",
+    "HIPAA": "HIPAA",
+    "SOC2": "SOC 2",
+}
+
+
+def _regulation_titles(regulations: dict) -> list[tuple[str, str]]:
+    """(menu title, code) pairs for a {code: (name, is_custom)} regulation index."""
+    return [
+        (f"[Custom] {name}" if is_custom else _FRIENDLY.get(code, code), code)
+        for code, (name, is_custom) in regulations.items()
+    ]
+
+
+def _numbered_choices(*titles: str) -> list:
+    """Build menu choices with 1..n number shortcuts."""
+    return [questionary.Choice(title, shortcut_key=str(i)) for i, title in enumerate(titles, 1)]
+
+
+# Static menus are built once instead of on every prompt
+_MAIN_MENU_CHOICES = _numbered_choices(
+    "Scan a project for compliance",
+    "Generate documentation",
+    "View remediation guide",
+    "View configuration",
+    "List available AI models",
+    "Run setup wizard",
+    "Show help",
+    "Exit Clausi",
+)
+
+_PATH_SELECT_CHOICES = _numbered_choices(
+    "Current directory (.)",
+    "Open file explorer...",
+    "Browse in terminal...",
+    "Type path manually",
+)
+
+_PROVIDER_CHOICES = _numbered_choices(
+    "Clausi AI hosted (up to 200,000 LOC, $3.00 minimum then $0.40 per 100,000 LOC)",
+    "Claude BYOK (no size limit, $0.50 minimum then $0.10 per 100,000 LOC plus your Anthropic bill)",
+    "OpenAI BYOK (no size limit, $0.50 minimum then $0.10 per 100,000 LOC plus your OpenAI bill)",
+)
+
+_CLAUDE_MODEL_CHOICES = _numbered_choices(
+    "claude-sonnet-4-20250514 (Recommended - best balance)",
+    "claude-3-5-sonnet-20241022 (Previous generation)",
+    "claude-3-opus-20240229 (Most capable, slower)",
+    "claude-3-5-haiku-20241022 (Fastest, cheapest)",
+)
+
+_OPENAI_MODEL_CHOICES = _numbered_choices(
+    "gpt-4o (Recommended - best balance)",
+    "gpt-4o-mini (Faster, cheaper)",
+    "gpt-4-turbo (Previous generation)",
+    "o1-preview (Advanced reasoning, expensive)",
+)
+
+# BYOK provider -> (config key, display name, key page, key prefix)
+_BYOK_KEYS = {
+    "claude": ("anthropic", "Anthropic", "https://console.anthropic.com/settings/keys", "sk-ant-"),
+    "openai": ("openai", "OpenAI", "https://platform.openai.com/api-keys", "sk-"),
+}
+
+_DOCS_PROVIDER_CHOICES = [
+    questionary.Choice("Clausi AI hosted (up to 200,000 LOC, $3.90 minimum then $0.52 per 100,000 LOC)", value="clausi", shortcut_key="1"),
+    questionary.Choice("Claude BYOK (no size limit, $0.65 minimum then $0.13 per 100,000 LOC plus your Anthropic bill)", value="claude", shortcut_key="2"),
+    questionary.Choice("OpenAI BYOK (no size limit, $0.65 minimum then $0.13 per 100,000 LOC plus your OpenAI bill)", value="openai", shortcut_key="3"),
+]
+
+_FORMAT_CHOICES = _numbered_choices(
+    "Markdown (default)",
+    "HTML",
+)
+
+_PRESET_CHOICES = _numbered_choices(
+    "Standard scan (all clauses)",
+    "Critical-only preset (faster, cheaper)",
+    "High-priority preset",
+)
+
+
+def run_cli(argv: list[str]) -> int:
+    """Run a clausi command in this interpreter and return its exit code."""
+    from clausi.cli import main
+    return main(argv)
+
+
+# Seconds to wait between balance checks after a payment-required scan
+BALANCE_POLL_DELAYS = (0.25, 0.5, 1.0, 2.0)
+
+
+def wait_for_balance_increase(balance_before: int | None) -> bool:
+    """Poll the credit balance with backoff until it rises above balance_before.
+
+    Returns True as soon as the balance increased, False once BALANCE_POLL_DELAYS is exhausted.
+    Without a starting balance there is nothing to compare, so it just waits out the delays.
+    """
+    from clausi.utils import config as config_module
+
+    if balance_before is None:
+        time.sleep(sum(BALANCE_POLL_DELAYS))
+        return False
+
+    for delay in BALANCE_POLL_DELAYS:
+        balance = config_module.get_credit_balance()
+        if balance is not None and balance > balance_before:
+            return True
+        time.sleep(delay)
+
+    balance = config_module.get_credit_balance()
+    return balance is not None and balance > balance_before
+
+
+def open_with_system_app(path) -> None:
+    """Open a file or folder with the platform's default application."""
+    if sys.platform == 'win32':
+        os.startfile(str(path))
+    elif sys.platform == 'darwin':
+        subprocess.Popen(["open", str(path)])
+    else:
+        subprocess.Popen(["xdg-open", str(path)])
+
+
+@functools.lru_cache(maxsize=32)
+def find_remediation_files(clausi_dir: str, mtime_ns: int) -> tuple[Path, ...]:
+    """Collect <regulation>/latest/REMEDIATION.md files under clausi_dir.
+
+    mtime_ns is the directory's modification time and only serves as part of the cache key.
+    """
+    remediation_files = []
+    try:
+        with os.scandir(clausi_dir) as it:
+            for entry in it:
+                if entry.is_dir():
+                    remediation_file = os.path.join(entry.path, "latest", "REMEDIATION.md")
+                    if os.path.isfile(remediation_file):
+                        remediation_files.append(Path(remediation_file))
+    except OSError:
+        return ()
+    return tuple(remediation_files)
+
+
+# Folder picker run in a child interpreter so tkinter is never loaded into this process
+_TK_DIALOG_SNIPPET = """
+import os
+import tkinter as tk
+from tkinter import filedialog
+
+root = tk.Tk()
+root.withdraw()
+root.attributes('-topmost', True)
+print(filedialog.askdirectory(title="Select Project Folder", initialdir=os.getcwd()) or "")
+root.destroy()
+"""
+
+# Seconds to wait for the user to pick a folder
+DIALOG_TIMEOUT = 600
+
+
+def _folder_dialog_commands() -> list[list[str]]:
+    """Folder picker commands to try, most native first."""
+    commands = []
+    if sys.platform == 'darwin':
+        commands.append(["osascript", "-e", 'POSIX path of (choose folder with prompt "Select Project Folder")'])
+    elif sys.platform != 'win32':
+        cwd = os.getcwd()
+        if shutil.which("zenity"):
+            commands.append(["zenity", "--file-selection", "--directory",
+                             "--title=Select Project Folder", f"--filename={cwd}/"])
+        if shutil.which("kdialog"):
+            commands.append(["kdialog", "--getexistingdirectory", cwd])
+    commands.append([sys.executable, "-c", _TK_DIALOG_SNIPPET])
+    return commands
+
+
 def open_native_file_dialog() -> str | None:
     """Open native OS file explorer dialog to select a folder.
 
-    Works on Windows, macOS, and Linux.
+    Works on Windows, macOS, and Linux. The dialog runs in a separate process
+    (zenity/kdialog, osascript, or a tkinter child interpreter).
     Returns the selected path or None if cancelled.
     """
-    try:
-        # Import tkinter (comes with Python)
-        import tkinter as tk
-        from tkinter import filedialog
-
-        # Create a hidden root window
-        root = tk.Tk()
-        root.withdraw()  # Hide the main window
-        root.attributes('-topmost', True)  # Bring dialog to front
-
-        # Open folder selection dialog
-        folder_path = filedialog.askdirectory(
-            title="Select Project Folder",
-            initialdir=os.getcwd()
-        )
+    for command in _folder_dialog_commands():
+        try:
+            result = subprocess.run(command, capture_output=True, text=True, timeout=DIALOG_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            return None
+        except OSError:
+            continue
 
-        root.destroy()
+        if result.returncode == 0:
+            folder_path = result.stdout.strip()
+            return folder_path if folder_path else None
 
-        return folder_path if folder_path else None
+        # Cancelling exits non-zero without an error message (osascript reports -128)
+        if not result.stderr.strip() or "(-128)" in result.stderr:
+            return None
 
-    except ImportError:
-        console.print("[yellow]Native file dialog not available (tkinter not installed)[/yellow]")
-        console.print("[dim]Falling back to terminal browser...[/dim]")
-        return None
-    except Exception as e:
-        console.print(f"[yellow]Could not open file dialog: {e}[/yellow]")
-        console.print("[dim]Falling back to terminal browser...[/dim]")
-        return None
+    console.print("[yellow]Could not open file dialog[/yellow]")
+    console.print("[dim]Falling back to terminal browser...[/dim]")
+    return None
 
 # Custom style for questionary prompts
 custom_style = Style([
@@ -82,6 +268,14 @@ custom_style = Style([
     ('selected', 'fg:cyan'),
 ])
 
+# Shared look for every select prompt
+_SELECT_KWARGS = dict(qmark="", pointer="→", style=custom_style, use_shortcuts=True)
+
+
+def _select(message: str, choices, **extra):
+    """Ask a questionary select prompt with the shared style; returns None if cancelled."""
+    return questionary.select(message, choices=choices, **{**_SELECT_KWARGS, **extra}).ask()
+
 
 class ClausInteractiveTUI:
     """Simple interactive Clausi interface with numbered menu."""
@@ -94,6 +288,18 @@ class ClausInteractiveTUI:
         """Run the interactive session."""
         console.print("\n[bold cyan]Clausi[/bold cyan] - AI Compliance Auditing\n")
 
+        # Menu title -> handler, looked up directly instead of comparing against each title
+        actions = {
+            "Scan a project for compliance": self.scan_wizard,
+            "Generate documentation": self.docs_wizard,
+            "View remediation guide": self.view_remediation_guide,
+            "View configuration": lambda: self._run_command(["config", "show"]),
+            "List available AI models": lambda: self._run_command(["models", "list"]),
+            "Run setup wizard": lambda: self._run_command(["setup"]),
+            "Show help": lambda: self._run_command(["--help"]),
+            "Exit Clausi": self._exit,
+        }
+
         while self.running:
             choice = self.show_main_menu()
 
@@ -102,47 +308,21 @@ class ClausInteractiveTUI:
                 console.print("\n[dim]Goodbye![/dim]\n")
                 break
 
-            if choice == "Scan a project for compliance":
-                self.scan_wizard()
-            elif choice == "Generate documentation":
-                self.docs_wizard()
-            elif choice == "View remediation guide":
-                self.view_remediation_guide()
-            elif choice == "View configuration":
-                os.system("clausi config show")
-                console.print()
-            elif choice == "List available AI models":
-                os.system("clausi models list")
-                console.print()
-            elif choice == "Run setup wizard":
-                os.system("clausi setup")
-                console.print()
-            elif choice == "Show help":
-                os.system("clausi --help")
-                console.print()
-            elif choice == "Exit Clausi":
-                console.print("\n[dim]Goodbye![/dim]\n")
-                self.running = False
+            actions[choice]()
+
+    def _run_command(self, argv: list[str]):
+        """Run a clausi command from the menu, followed by a blank line."""
+        run_cli(argv)
+        console.print()
+
+    def _exit(self):
+        """Leave the menu loop."""
+        console.print("\n[dim]Goodbye![/dim]\n")
+        self.running = False
 
     def show_main_menu(self):
         """Display the main menu with arrow key navigation and number shortcuts."""
-        choices = [
-            questionary.Choice("Scan a project for compliance", shortcut_key="1"),
-            questionary.Choice("Generate documentation", shortcut_key="2"),
-            questionary.Choice("View remediation guide", shortcut_key="3"),
-            questionary.Choice("View configuration", shortcut_key="4"),
-            questionary.Choice("List available AI models", shortcut_key="5"),
-            questionary.Choice("Run setup wizard", shortcut_key="6"),
-            questionary.Choice("Show help", shortcut_key="7"),
-            questionary.Choice("Exit Clausi", shortcut_key="8")
-        ]
-        result = questionary.select(
-            "What would you like to do?",
-            choices=choices,
-            qmark="",
-            pointer="→",
-            use_shortcuts=True
-        ).ask()
+        result = _select("What would you like to do?", _MAIN_MENU_CHOICES)
         return result if result else None
 
     def find_remediation_files(self, project_path: str = None) -> list[Path]:
@@ -150,38 +330,17 @@ class ClausInteractiveTUI:
 
         Returns list of paths to remediation files found.
         """
-        remediation_files = []
-
-        if project_path:
-            search_path = Path(project_path)
-        else:
-            search_path = Path.cwd()
-
-        clausi_dir = search_path / "clausi"
-
-        if not clausi_dir.exists():
+        clausi_dir = os.path.join(project_path or os.getcwd(), "clausi")
+        try:
+            mtime_ns = os.stat(clausi_dir).st_mtime_ns
+        except OSError:
             return []
-
-        # Search for REMEDIATION.md in all regulation folders
-        for reg_dir in clausi_dir.iterdir():
-            if reg_dir.is_dir():
-                latest_dir = reg_dir / "latest"
-                if latest_dir.exists():
-                    remediation_file = latest_dir / "REMEDIATION.md"
-                    if remediation_file.exists():
-                        remediation_files.append(remediation_file)
-
-        return remediation_files
+        return list(find_remediation_files(clausi_dir, mtime_ns))
 
     def open_file(self, file_path: Path):
         """Open a file in the default system application."""
         try:
-            if sys.platform == 'win32':
-                os.startfile(str(file_path))
-            elif sys.platform == 'darwin':
-                os.system(f'open "{file_path}"')
-            else:
-                os.system(f'xdg-open "{file_path}"')
+            open_with_system_app(file_path)
             console.print(f"[green]✓[/green] Opened: {file_path}")
         except Exception as e:
             console.print(f"[red]Error opening file: {e}[/red]")
@@ -242,13 +401,7 @@ class ClausInteractiveTUI:
             choices.append(make_choice("Open all", num))
             choices.append(make_choice("Cancel", num + 1))
 
-            choice = questionary.select(
-                "Multiple remediation guides found. Select one:",
-                choices=choices,
-                qmark="",
-                pointer="→",
-                use_shortcuts=True
-            ).ask()
+            choice = _select("Multiple remediation guides found. Select one:", choices)
 
             if choice is None or choice == "Cancel":
                 console.print("[yellow]Cancelled[/yellow]\n")
@@ -283,24 +436,20 @@ class ClausInteractiveTUI:
 
             # Add subdirectories
             try:
-                subdirs = sorted([
-                    d.name + "/" for d in current_path.iterdir()
-                    if d.is_dir() and not d.name.startswith('.')
-                ])
+                # DirEntry.is_dir() uses the entry type from the directory listing, so only symlinks need a stat
+                with os.scandir(current_path) as it:
+                    subdirs = sorted(
+                        entry.name + "/" for entry in it
+                        if not entry.name.startswith('.') and entry.is_dir()
+                    )
                 choices.extend(subdirs)
-            except PermissionError:
+            except OSError:
                 console.print("[yellow]Permission denied for some directories[/yellow]")
 
             # Show current location
             console.print(f"\n[dim]Current: {current_path}[/dim]")
 
-            selection = questionary.select(
-                "Select a directory:",
-                choices=choices,
-                qmark="",
-                pointer="→",
-                style=custom_style
-            ).ask()
+            selection = _select("Select a directory:", choices, use_shortcuts=False)
 
             if selection is None:
                 return None
@@ -318,21 +467,7 @@ class ClausInteractiveTUI:
 
         Returns the selected path or None if cancelled.
         """
-        choices = [
-            questionary.Choice("Current directory (.)", shortcut_key="1"),
-            questionary.Choice("Open file explorer...", shortcut_key="2"),
-            questionary.Choice("Browse in terminal...", shortcut_key="3"),
-            questionary.Choice("Type path manually", shortcut_key="4")
-        ]
-
-        choice = questionary.select(
-            "Select project location:",
-            choices=choices,
-            qmark="",
-            pointer="→",
-            style=custom_style,
-            use_shortcuts=True
-        ).ask()
+        choice = _select("Select project location:", _PATH_SELECT_CHOICES)
 
         if choice is None:
             return None
@@ -386,8 +521,7 @@ class ClausInteractiveTUI:
             return None
 
         # Generate code from name (e.g., "Company Security Policy" -> "COMPANY-SECURITY-POLICY")
-        reg_code = reg_name.upper().replace(" ", "-").replace("_", "-")
-        reg_code = ''.join(c for c in reg_code if c.isalnum() or c == '-')
+        reg_code = _REG_CODE_INVALID.sub('', reg_name.upper().translate(_REG_CODE_SEPARATORS))
 
         # Ask where to save
         save_choices = [
@@ -396,12 +530,7 @@ class ClausInteractiveTUI:
         ]
 
         if project_path:
-            save_choice = questionary.select(
-                "Where to save?",
-                choices=save_choices,
-                qmark="",
-                pointer="→"
-            ).ask()
+            save_choice = _select("Where to save?", save_choices, use_shortcuts=False)
         else:
             save_choice = save_choices[0]  # Default to global if no project
 
@@ -452,12 +581,7 @@ class ClausInteractiveTUI:
             ).ask()
 
             if open_file:
-                if sys.platform == 'win32':
-                    os.startfile(str(file_path))
-                elif sys.platform == 'darwin':
-                    os.system(f'open "{file_path}"')
-                else:
-                    os.system(f'xdg-open "{file_path}"')
+                open_with_system_app(file_path)
 
             return reg_code
 
@@ -470,117 +594,55 @@ class ClausInteractiveTUI:
 
         Returns list of selected regulation codes, or None if cancelled.
         """
-        # Fetch built-in and discover custom regulations
-        built_in_regs = regs_module.get_regulations()
-        custom_regs = regs_module.discover_custom_regulations(
+        # Regulations pull in requests/yaml, so they are imported on first use
+        from clausi.utils import regulations as regs_module
+
+        # Built-in and custom regulations as one {code: (name, is_custom)} mapping
+        regulations = regs_module.get_regulation_index(
             project_path=Path(project_path) if project_path else None
         )
 
-        # Build simple choices - one regulation at a time with number shortcuts
+        # One regulation at a time with number shortcuts
         # Note: questionary shortcuts only support single characters (1-9)
-        choices = []
-        reg_mapping = {}  # Display text -> code
-        num = 1
-
-        def make_choice(text, shortcut_num):
-            """Create choice with shortcut only if num <= 9"""
-            if shortcut_num <= 9:
-                return questionary.Choice(text, shortcut_key=str(shortcut_num))
-            else:
-                return questionary.Choice(text)  # No shortcut for 10+
-
-        # Add built-in regulations with friendly names
-        friendly_names = {
-            "EU-AIA": "EU AI Act (EU-AIA)",
-            "GDPR": "GDPR",
-            "ISO-42001": "ISO 42001",
-            "HIPAA": "HIPAA",
-            "SOC2": "SOC 2"
-        }
-
-        for code in built_in_regs.keys():
-            name = friendly_names.get(code, code)
-            choices.append(make_choice(name, num))
-            reg_mapping[name] = code
-            num += 1
-
-        # Add custom regulations
-        if custom_regs:
-            for code, path in custom_regs.items():
-                reg_data = regs_module.load_custom_regulation(path)
-                name = reg_data.get('name', code) if reg_data else code
-                display = f"[Custom] {name}"
-                choices.append(make_choice(display, num))
-                reg_mapping[display] = code
-                num += 1
+        # Each choice's value is the regulation code (or a sentinel), so the answer needs no lookup
+        entries = _regulation_titles(regulations)
+        entries.append(("Create new custom regulation", _CREATE_REGULATION))
+        entries.append(("Scan multiple regulations", _MULTIPLE_REGULATIONS))
 
-        # Add create custom option
-        create_custom_display = "Create new custom regulation"
-        choices.append(make_choice(create_custom_display, num))
-        num += 1
+        choices = [
+            questionary.Choice(title, value=value, shortcut_key=str(num) if num <= 9 else None)
+            for num, (title, value) in enumerate(entries, 1)
+        ]
 
-        # Add separator and advanced option
-        choices.append(questionary.Separator("── Advanced ──"))
-        multi_reg_display = "Scan multiple regulations"
-        choices.append(make_choice(multi_reg_display, num))
+        # Separate the advanced option from the regulations
+        choices.insert(-1, questionary.Separator("── Advanced ──"))
 
-        result = questionary.select(
-            "Select regulation to scan against:",
-            choices=choices,
-            qmark="",
-            pointer="→",
-            style=custom_style,
-            use_shortcuts=True
-        ).ask()
+        result = _select("Select regulation to scan against:", choices)
 
         if result is None:
             return None
 
         # Handle special options
-        if "Create new custom regulation" in result:
+        if result == _CREATE_REGULATION:
             new_code = self.create_custom_regulation(project_path)
             if new_code:
                 console.print(f"\n[green]✓[/green] Custom regulation '{new_code}' created!")
                 return [new_code]
             return None
 
-        if "Scan multiple regulations" in result:
-            return self._select_multiple_regulations(built_in_regs, custom_regs)
+        if result == _MULTIPLE_REGULATIONS:
+            return self._select_multiple_regulations(regulations)
 
         # Return single selected regulation
-        if result in reg_mapping:
-            return [reg_mapping[result]]
-
-        return None
+        return [result]
 
-    def _select_multiple_regulations(self, built_in_regs: dict, custom_regs: dict) -> list[str] | None:
+    def _select_multiple_regulations(self, regulations: dict) -> list[str] | None:
         """Advanced multi-select for scanning multiple regulations at once."""
         # Show warning
         console.print("\n[yellow]Note:[/yellow] Multi-regulation scans generate separate reports per regulation")
         console.print("[yellow]and may increase scan time and cost.[/yellow]\n")
 
-        # Build checkbox choices
-        choices = []
-        reg_mapping = {}
-
-        friendly_names = {
-            "EU-AIA": "EU AI Act",
-            "GDPR": "GDPR",
-            "ISO-42001": "ISO 42001",
-            "HIPAA": "HIPAA",
-            "SOC2": "SOC 2"
-        }
-
-        for code in built_in_regs.keys():
-            display = friendly_names.get(code, code)
-            choices.append(questionary.Choice(display, value=code))
-
-        # Add custom regulations
-        if custom_regs:
-            for code, path in custom_regs.items():
-                reg_data = regs_module.load_custom_regulation(path)
-                name = reg_data.get('name', code) if reg_data else code
-                choices.append(questionary.Choice(f"[Custom] {name}", value=code))
+        choices = [questionary.Choice(title, value=code) for title, code in _regulation_titles(regulations)]
 
         selected = questionary.checkbox(
             "Select multiple regulations (Space to toggle, Enter to confirm):",
@@ -595,6 +657,53 @@ class ClausInteractiveTUI:
 
         return selected
 
+    def _ensure_byok_key(self, provider: str, cancelled: str = "Cancelled") -> bool:
+        """Make sure a BYOK provider has an API key, asking for one if it is missing.
+
+        Args:
+            provider: BYOK provider tag, "claude" or "openai"
+            cancelled: Message shown when the user does not paste a key
+
+        Returns:
+            True when a key is available, False if the wizard should stop
+        """
+        from clausi.utils import config as config_module
+
+        config_key, name, url, prefix = _BYOK_KEYS[provider]
+        get_key = config_module.get_anthropic_key if provider == "claude" else config_module.get_openai_key
+        if get_key():
+            return True
+
+        console.print(f"\n[yellow]{name} API key not found.[/yellow]")
+        console.print("[dim]Opening browser to get your API key...[/dim]\n")
+
+        # Open the browser off-thread so the prompt below appears immediately,
+        # and load the config while the user is busy there
+        import webbrowser
+        threading.Thread(target=webbrowser.open, args=(url,), kwargs={"new": 2}, daemon=True).start()
+        background = ThreadPoolExecutor(max_workers=1)
+        config_future = background.submit(config_module.load_config)
+        background.shutdown(wait=False)
+
+        console.print("[cyan]1.[/cyan] Create a new API key in the browser")
+        console.print(f"[cyan]2.[/cyan] Copy the key (starts with {prefix}...)")
+        console.print("[cyan]3.[/cyan] Paste it below\n")
+
+        api_key = Prompt.ask(f"[cyan]Paste your {name} API key[/cyan]")
+        if not (api_key and api_key.strip()):
+            console.print(f"[yellow]No API key provided. {cancelled}.[/yellow]\n")
+            return False
+
+        # Save to config
+        config = config_future.result() or {}
+        config.setdefault("api_keys", {})[config_key] = api_key.strip()
+        if not config_module.save_config(config):
+            console.print("[red]Failed to save API key[/red]\n")
+            return False
+
+        console.print("[green]✓[/green] API key saved! You won't need to enter it again.\n")
+        return True
+
     def scan_wizard(self):
         """Interactive scan wizard with numbered steps."""
         console.print("\n[bold cyan]Scan Wizard[/bold cyan]\n")
@@ -606,51 +715,31 @@ class ClausInteractiveTUI:
             console.print("\n[yellow]Scan cancelled[/yellow]\n")
             return
 
-        if not os.path.exists(path):
+        # One realpath call both checks existence and resolves the path
+        try:
+            abs_path = os.path.realpath(path, strict=True)
+        except OSError:
             console.print(f"[red]Error: Path '{path}' does not exist[/red]\n")
             return
 
-        console.print(f"[green]Selected:[/green] {Path(path).resolve()}")
+        console.print(f"[green]Selected:[/green] {abs_path}")
 
         # Step 2: AI Provider
         console.print()
-        provider_choices = [
-            questionary.Choice("Clausi AI hosted (up to 200,000 LOC, $3.00 minimum then $0.40 per 100,000 LOC)", shortcut_key="1"),
-            questionary.Choice("Claude BYOK (no size limit, $0.50 minimum then $0.10 per 100,000 LOC plus your Anthropic bill)", shortcut_key="2"),
-            questionary.Choice("OpenAI BYOK (no size limit, $0.50 minimum then $0.10 per 100,000 LOC plus your OpenAI bill)", shortcut_key="3")
-        ]
-        provider_choice = questionary.select(
-            "Select AI provider:",
-            choices=provider_choices,
-            qmark="",
-            pointer="→",
-            use_shortcuts=True
-        ).ask()
+        provider_choice = _select("Select AI provider:", _PROVIDER_CHOICES)
 
         # Handle user cancellation
         if provider_choice is None:
             console.print("\n[yellow]Scan cancelled[/yellow]\n")
             return
 
-        # Default provider flags (will be updated with model selection)
-        provider_flag = ""
+        # Default provider arguments (will be updated with model selection)
+        provider_args = []
 
         # Step 2b: Model selection for BYOK providers
         if "Claude" in provider_choice:
             console.print()
-            claude_models = [
-                questionary.Choice("claude-sonnet-4-20250514 (Recommended - best balance)", shortcut_key="1"),
-                questionary.Choice("claude-3-5-sonnet-20241022 (Previous generation)", shortcut_key="2"),
-                questionary.Choice("claude-3-opus-20240229 (Most capable, slower)", shortcut_key="3"),
-                questionary.Choice("claude-3-5-haiku-20241022 (Fastest, cheapest)", shortcut_key="4")
-            ]
-            model_choice = questionary.select(
-                "Select Claude model:",
-                choices=claude_models,
-                qmark="",
-                pointer="→",
-                use_shortcuts=True
-            ).ask()
+            model_choice = _select("Select Claude model:", _CLAUDE_MODEL_CHOICES)
 
             if model_choice is None:
                 console.print("\n[yellow]Scan cancelled[/yellow]\n")
@@ -658,23 +747,11 @@ class ClausInteractiveTUI:
 
             # Extract model name from choice
             model_name = model_choice.split(" (")[0]
-            provider_flag = f"--claude {model_name}"
+            provider_args = ["--claude", model_name]
 
         elif "OpenAI" in provider_choice:
             console.print()
-            openai_models = [
-                questionary.Choice("gpt-4o (Recommended - best balance)", shortcut_key="1"),
-                questionary.Choice("gpt-4o-mini (Faster, cheaper)", shortcut_key="2"),
-                questionary.Choice("gpt-4-turbo (Previous generation)", shortcut_key="3"),
-                questionary.Choice("o1-preview (Advanced reasoning, expensive)", shortcut_key="4")
-            ]
-            model_choice = questionary.select(
-                "Select OpenAI model:",
-                choices=openai_models,
-                qmark="",
-                pointer="→",
-                use_shortcuts=True
-            ).ask()
+            model_choice = _select("Select OpenAI model:", _OPENAI_MODEL_CHOICES)
 
             if model_choice is None:
                 console.print("\n[yellow]Scan cancelled[/yellow]\n")
@@ -682,68 +759,17 @@ class ClausInteractiveTUI:
 
             # Extract model name from choice
             model_name = model_choice.split(" (")[0]
-            provider_flag = f"--openai {model_name}"
+            provider_args = ["--openai", model_name]
 
         # Clausi AI uses default model, no flag needed
 
         # Check if BYOK provider selected and API key is missing
-        from clausi.utils import config as config_module
-
         if "Claude" in provider_choice:
-            api_key = config_module.get_anthropic_key()
-            if not api_key:
-                console.print("\n[yellow]Anthropic API key not found.[/yellow]")
-                console.print("[dim]Opening browser to get your API key...[/dim]\n")
-
-                # Open browser to Anthropic console
-                import webbrowser
-                webbrowser.open("https://console.anthropic.com/settings/keys")
-
-                console.print("[cyan]1.[/cyan] Create a new API key in the browser")
-                console.print("[cyan]2.[/cyan] Copy the key (starts with sk-ant-...)")
-                console.print("[cyan]3.[/cyan] Paste it below\n")
-
-                api_key = Prompt.ask("[cyan]Paste your Anthropic API key[/cyan]")
-                if api_key and api_key.strip():
-                    # Save to config
-                    config = config_module.load_config() or {}
-                    config.setdefault("api_keys", {})["anthropic"] = api_key.strip()
-                    if config_module.save_config(config):
-                        console.print("[green]✓[/green] API key saved! You won't need to enter it again.\n")
-                    else:
-                        console.print("[red]Failed to save API key[/red]\n")
-                        return
-                else:
-                    console.print("[yellow]No API key provided. Scan cancelled.[/yellow]\n")
-                    return
-
+            if not self._ensure_byok_key("claude", "Scan cancelled"):
+                return
         elif "OpenAI" in provider_choice:
-            api_key = config_module.get_openai_key()
-            if not api_key:
-                console.print("\n[yellow]OpenAI API key not found.[/yellow]")
-                console.print("[dim]Opening browser to get your API key...[/dim]\n")
-
-                # Open browser to OpenAI API keys page
-                import webbrowser
-                webbrowser.open("https://platform.openai.com/api-keys")
-
-                console.print("[cyan]1.[/cyan] Create a new API key in the browser")
-                console.print("[cyan]2.[/cyan] Copy the key (starts with sk-...)")
-                console.print("[cyan]3.[/cyan] Paste it below\n")
-
-                api_key = Prompt.ask("[cyan]Paste your OpenAI API key[/cyan]")
-                if api_key and api_key.strip():
-                    # Save to config
-                    config = config_module.load_config() or {}
-                    config.setdefault("api_keys", {})["openai"] = api_key.strip()
-                    if config_module.save_config(config):
-                        console.print("[green]✓[/green] API key saved! You won't need to enter it again.\n")
-                    else:
-                        console.print("[red]Failed to save API key[/red]\n")
-                        return
-                else:
-                    console.print("[yellow]No API key provided. Scan cancelled.[/yellow]\n")
-                    return
+            if not self._ensure_byok_key("openai", "Scan cancelled"):
+                return
 
         # Step 3: Regulations - now with proper checkbox selection
         console.print()
@@ -753,63 +779,41 @@ class ClausInteractiveTUI:
             console.print("\n[yellow]Scan cancelled[/yellow]\n")
             return
 
-        # Build regulation flags
-        reg_flags = " ".join([f"-r {r}" for r in selected_regs])
+        # Build regulation arguments
+        reg_args = [arg for reg in selected_regs for arg in ("-r", reg)]
 
         # Step 4: Additional options
         console.print()
-        preset_choices = [
-            questionary.Choice("Standard scan (all clauses)", shortcut_key="1"),
-            questionary.Choice("Critical-only preset (faster, cheaper)", shortcut_key="2"),
-            questionary.Choice("High-priority preset", shortcut_key="3")
-        ]
-        preset_choice = questionary.select(
-            "Additional options:",
-            choices=preset_choices,
-            qmark="",
-            pointer="→",
-            use_shortcuts=True
-        ).ask()
+        preset_choice = _select("Additional options:", _PRESET_CHOICES)
 
         # Handle user cancellation
         if preset_choice is None:
             console.print("\n[yellow]Scan cancelled[/yellow]\n")
             return
 
-        preset_flag = ""
+        preset_args = []
         if preset_choice == "Critical-only preset (faster, cheaper)":
-            preset_flag = "--preset critical-only"
+            preset_args = ["--preset", "critical-only"]
         elif preset_choice == "High-priority preset":
-            preset_flag = "--preset high-priority"
-
-        # Build and run command
-        cmd_parts = ["clausi", "scan"]
+            preset_args = ["--preset", "high-priority"]
 
-        # Quote path if it contains spaces
-        if " " in path:
-            cmd_parts.append(f'"{path}"')
-        else:
-            cmd_parts.append(path)
-
-        cmd_parts.extend(reg_flags.split())
-        if provider_flag:
-            cmd_parts.extend(provider_flag.split())
-        if preset_flag:
-            cmd_parts.extend(preset_flag.split())
-        cmd_parts.append("--open-findings")
+        # Build and run command in-process; arguments are passed as a list, so no quoting is needed
+        argv = ["scan", path, *reg_args, *provider_args, *preset_args, "--open-findings"]
 
-        cmd = " ".join(cmd_parts)
+        cmd = shlex.join(["clausi", *argv])
 
         console.print(f"\n[dim]Running: {cmd}[/dim]\n")
-        exit_code = os.system(cmd)
+        exit_code = run_cli(argv)
 
         # Track the scanned path for remediation feature
-        abs_path = str(Path(path).resolve())
         self.last_scan_path = abs_path
 
         # Handle different exit codes
         # Exit code 0 = success, 2 = payment required (insufficient balance), other = error
         if exit_code == 0:
+            # The scan may have written new guides without touching the clausi/ directory itself
+            find_remediation_files.cache_clear()
+
             # Scan completed successfully - offer to view remediation guide
             remediation_files = self.find_remediation_files(abs_path)
             if remediation_files:
@@ -822,19 +826,22 @@ class ClausInteractiveTUI:
                     self.view_remediation_guide(abs_path)
             else:
                 console.print("[dim]No remediation guide generated for this scan.[/dim]")
-        elif exit_code == 512:  # os.system returns exit_code * 256, so 2 * 256 = 512
+        elif exit_code == 2:
             # Payment required - prompt to rescan after adding funds
+            from clausi.utils import config as config_module
+
+            balance_before = config_module.get_credit_balance()
             console.print()
             rescan = questionary.confirm(
                 "Re-run scan after adding funds?",
                 default=True
             ).ask()
             if rescan:
-                console.print("\n[dim]Waiting 5 seconds for payment to process...[/dim]")
-                import time
-                time.sleep(5)
+                console.print("\n[dim]Waiting for payment to process...[/dim]")
+                if not wait_for_balance_increase(balance_before):
+                    console.print("[dim]Balance has not updated yet; re-running anyway.[/dim]")
                 console.print(f"\n[dim]Re-running: {cmd}[/dim]\n")
-                os.system(cmd)
+                run_cli(argv)
         # For other exit codes (errors), don't prompt anything
 
         console.print()
@@ -851,139 +858,54 @@ class ClausInteractiveTUI:
             console.print("\n[yellow]Cancelled[/yellow]\n")
             return
 
-        if not os.path.exists(path):
+        # One realpath call both checks existence and resolves the path
+        try:
+            abs_path = os.path.realpath(path, strict=True)
+        except OSError:
             console.print(f"[red]Error: Path '{path}' does not exist[/red]\n")
             return
 
-        console.print(f"[green]Selected:[/green] {Path(path).resolve()}")
+        console.print(f"[green]Selected:[/green] {abs_path}")
 
         # Step 2: AI Provider
         console.print()
         console.print("[dim]Docs generation has a 30% premium on scan pricing.[/dim]\n")
 
-        provider_choices = [
-            questionary.Choice("Clausi AI hosted (up to 200,000 LOC, $3.90 minimum then $0.52 per 100,000 LOC)", shortcut_key="1"),
-            questionary.Choice("Claude BYOK (no size limit, $0.65 minimum then $0.13 per 100,000 LOC plus your Anthropic bill)", shortcut_key="2"),
-            questionary.Choice("OpenAI BYOK (no size limit, $0.65 minimum then $0.13 per 100,000 LOC plus your OpenAI bill)", shortcut_key="3")
-        ]
-        provider_choice = questionary.select(
-            "Select AI provider:",
-            choices=provider_choices,
-            qmark="",
-            pointer="→",
-            use_shortcuts=True
-        ).ask()
+        # The answer is the provider tag ("clausi", "claude" or "openai"), which is also its CLI flag
+        provider = _select("Select AI provider:", _DOCS_PROVIDER_CHOICES)
 
-        if provider_choice is None:
+        if provider is None:
             console.print("\n[yellow]Cancelled[/yellow]\n")
             return
 
-        provider_flag = ""
-        if "Claude" in provider_choice:
-            provider_flag = "--claude"
-        elif "OpenAI" in provider_choice:
-            provider_flag = "--openai"
-        elif "Clausi AI" in provider_choice:
-            provider_flag = "--clausi"
+        provider_args = [f"--{provider}"]
 
         # Check API key if BYOK
-        from clausi.utils import config as config_module
-
-        if "Claude" in provider_choice:
-            api_key = config_module.get_anthropic_key()
-            if not api_key:
-                console.print("\n[yellow]Anthropic API key not found.[/yellow]")
-                console.print("[dim]Opening browser to get your API key...[/dim]\n")
-
-                import webbrowser
-                webbrowser.open("https://console.anthropic.com/settings/keys")
-
-                console.print("[cyan]1.[/cyan] Create a new API key in the browser")
-                console.print("[cyan]2.[/cyan] Copy the key (starts with sk-ant-...)")
-                console.print("[cyan]3.[/cyan] Paste it below\n")
-
-                api_key = Prompt.ask("[cyan]Paste your Anthropic API key[/cyan]")
-                if api_key and api_key.strip():
-                    config = config_module.load_config() or {}
-                    config.setdefault("api_keys", {})["anthropic"] = api_key.strip()
-                    if config_module.save_config(config):
-                        console.print("[green]✓[/green] API key saved!\n")
-                    else:
-                        console.print("[red]Failed to save API key[/red]\n")
-                        return
-                else:
-                    console.print("[yellow]No API key provided. Cancelled.[/yellow]\n")
-                    return
-
-        elif "OpenAI" in provider_choice:
-            api_key = config_module.get_openai_key()
-            if not api_key:
-                console.print("\n[yellow]OpenAI API key not found.[/yellow]")
-                console.print("[dim]Opening browser to get your API key...[/dim]\n")
-
-                import webbrowser
-                webbrowser.open("https://platform.openai.com/api-keys")
-
-                console.print("[cyan]1.[/cyan] Create a new API key in the browser")
-                console.print("[cyan]2.[/cyan] Copy the key (starts with sk-...)")
-                console.print("[cyan]3.[/cyan] Paste it below\n")
-
-                api_key = Prompt.ask("[cyan]Paste your OpenAI API key[/cyan]")
-                if api_key and api_key.strip():
-                    config = config_module.load_config() or {}
-                    config.setdefault("api_keys", {})["openai"] = api_key.strip()
-                    if config_module.save_config(config):
-                        console.print("[green]✓[/green] API key saved!\n")
-                    else:
-                        console.print("[red]Failed to save API key[/red]\n")
-                        return
-                else:
-                    console.print("[yellow]No API key provided. Cancelled.[/yellow]\n")
-                    return
+        if provider in _BYOK_KEYS and not self._ensure_byok_key(provider):
+            return
 
         # Step 3: Output format
         console.print()
-        format_choices = [
-            questionary.Choice("Markdown (default)", shortcut_key="1"),
-            questionary.Choice("HTML", shortcut_key="2")
-        ]
-        format_choice = questionary.select(
-            "Output format:",
-            choices=format_choices,
-            qmark="",
-            pointer="→",
-            use_shortcuts=True
-        ).ask()
+        format_choice = _select("Output format:", _FORMAT_CHOICES)
 
         if format_choice is None:
             console.print("\n[yellow]Cancelled[/yellow]\n")
             return
 
-        format_flag = ""
+        format_args = []
         if "HTML" in format_choice:
-            format_flag = "--format html"
-
-        # Build and run command
-        cmd_parts = ["clausi", "docs", "generate"]
-
-        if " " in path:
-            cmd_parts.append(f'"{path}"')
-        else:
-            cmd_parts.append(path)
+            format_args = ["--format", "html"]
 
-        if provider_flag:
-            cmd_parts.append(provider_flag)
-        if format_flag:
-            cmd_parts.extend(format_flag.split())
+        # Build and run command in-process
+        argv = ["docs", "generate", path, *provider_args, *format_args]
 
-        cmd = " ".join(cmd_parts)
+        cmd = shlex.join(["clausi", *argv])
 
         console.print(f"\n[dim]Running: {cmd}[/dim]\n")
-        exit_code = os.system(cmd)
+        exit_code = run_cli(argv)
 
         if exit_code == 0:
-            abs_path = Path(path).resolve()
-            docs_dir = abs_path / "clausi" / "docs" / "latest"
+            docs_dir = Path(abs_path) / "clausi" / "docs" / "latest"
             if docs_dir.exists():
                 console.print(f"\n[green]✓[/green] Documentation generated in: {docs_dir}")
 
@@ -998,12 +920,7 @@ class ClausInteractiveTUI:
                         self.open_file(index_file)
                     else:
                         # Open the directory
-                        if sys.platform == 'win32':
-                            os.startfile(str(docs_dir))
-                        elif sys.platform == 'darwin':
-                            os.system(f'open "{docs_dir}"')
-                        else:
-                            os.system(f'xdg-open "{docs_dir}"')
+                        open_with_system_app(docs_dir)
 
         console.print()
 
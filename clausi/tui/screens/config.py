@@ -1,6 +1,7 @@
 """Configuration editor screen for TUI."""
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -10,7 +11,40 @@ from textual.screen import Screen
 from textual.widgets import Button, Input, Label, Static, Select
 from textual.binding import Binding
 
-from clausi.utils.config import load_config, save_config, get_config_path
+from clausi.utils.config import load_config, save_config, get_config_path, get_http_session
+
+
+# Seconds to wait for the API key check endpoints
+KEY_CHECK_TIMEOUT = 5
+
+
+def _check_key_endpoint(url: str, headers: dict) -> None:
+    """GET a provider's model list endpoint and raise if the key is rejected.
+
+    The response is streamed and closed right after the headers, so the body is never downloaded.
+    """
+    response = get_http_session().get(url, headers=headers, timeout=KEY_CHECK_TIMEOUT, stream=True)
+    response.close()
+    if response.status_code == 401:
+        raise Exception("invalid API key")
+    if response.status_code != 200:
+        raise Exception(f"HTTP {response.status_code}")
+
+
+def _anthropic_key_check(api_key: str) -> None:
+    """Check an Anthropic key with the model list endpoint (no billable completion)."""
+    _check_key_endpoint(
+        "https://api.anthropic.com/v1/models?limit=1",
+        {"x-api-key": api_key, "anthropic-version": "2023-06-01"},
+    )
+
+
+def _openai_key_check(api_key: str) -> None:
+    """Check an OpenAI key; only the status line of the model list is needed."""
+    _check_key_endpoint(
+        "https://api.openai.com/v1/models",
+        {"Authorization": f"Bearer {api_key}"},
+    )
 
 
 class ConfigScreen(Screen):
@@ -108,26 +142,28 @@ class ConfigScreen(Screen):
             with Horizontal(classes="config-row"):
                 yield Label("Anthropic API Key:", classes="config-label")
                 anthropic_key = self.config.get("api_keys", {}).get("anthropic", "")
-                yield Input(
+                self._anthropic_input = Input(
                     value=anthropic_key,
                     placeholder="sk-ant-...",
                     password=True,
                     id="anthropic-key",
                     classes="config-input"
                 )
+                yield self._anthropic_input
 
             yield Static("Get your key from: https://console.anthropic.com", classes="hint")
 
             with Horizontal(classes="config-row"):
                 yield Label("OpenAI API Key:", classes="config-label")
                 openai_key = self.config.get("api_keys", {}).get("openai", "") or self.config.get("openai_key", "")
-                yield Input(
+                self._openai_input = Input(
                     value=openai_key,
                     placeholder="sk-...",
                     password=True,
                     id="openai-key",
                     classes="config-input"
                 )
+                yield self._openai_input
 
             yield Static("Get your key from: https://platform.openai.com/api-keys", classes="hint")
 
@@ -137,12 +173,13 @@ class ConfigScreen(Screen):
             with Horizontal(classes="config-row"):
                 yield Label("Default Provider:", classes="config-label")
                 provider = self.config.get("ai", {}).get("provider", "claude")
-                yield Select(
+                self._provider_select = Select(
                     [("Claude (Anthropic)", "claude"), ("OpenAI", "openai")],
                     value=provider,
                     id="ai-provider",
                     classes="config-input"
                 )
+                yield self._provider_select
 
             # Report Settings section
             yield Static("Report Settings", classes="section-title")
@@ -150,35 +187,39 @@ class ConfigScreen(Screen):
             with Horizontal(classes="config-row"):
                 yield Label("Output Directory:", classes="config-label")
                 output_dir = self.config.get("report", {}).get("output_dir", "reports")
-                yield Input(
+                self._output_dir_input = Input(
                     value=output_dir,
                     placeholder="reports",
                     id="output-dir",
                     classes="config-input"
                 )
+                yield self._output_dir_input
 
             with Horizontal(classes="config-row"):
                 yield Label("Report Format:", classes="config-label")
                 report_format = self.config.get("report", {}).get("format", "pdf")
-                yield Select(
+                self._format_select = Select(
                     [("PDF", "pdf"), ("HTML", "html"), ("JSON", "json"), ("All Formats", "all")],
                     value=report_format,
                     id="report-format",
                     classes="config-input"
                 )
+                yield self._format_select
 
             with Horizontal(classes="config-row"):
                 yield Label("Company Name:", classes="config-label")
                 company_name = self.config.get("report", {}).get("company_name", "")
-                yield Input(
+                self._company_input = Input(
                     value=company_name,
                     placeholder="ACME Corp",
                     id="company-name",
                     classes="config-input"
                 )
+                yield self._company_input
 
             # Status message
-            yield Static("", id="status", classes="status-message")
+            self._status = Static("", id="status", classes="status-message")
+            yield self._status
 
             # Action buttons
             with Horizontal(id="button-bar"):
@@ -186,6 +227,12 @@ class ConfigScreen(Screen):
                 yield Button("Test Connection", variant="success", id="test-button")
                 yield Button("Cancel [Esc]", variant="error", id="cancel-button")
 
+    def _set_status(self, ok: bool, message: str) -> None:
+        """Show a success or error message in the status line."""
+        self._status.update(message)
+        self._status.set_class(ok, "success")
+        self._status.set_class(not ok, "error")
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
         button_id = event.button.id
@@ -201,12 +248,12 @@ class ConfigScreen(Screen):
         """Save the configuration."""
         try:
             # Get values from inputs
-            anthropic_key = self.query_one("#anthropic-key", Input).value.strip()
-            openai_key = self.query_one("#openai-key", Input).value.strip()
-            ai_provider = self.query_one("#ai-provider", Select).value
-            output_dir = self.query_one("#output-dir", Input).value.strip()
-            report_format = self.query_one("#report-format", Select).value
-            company_name = self.query_one("#company-name", Input).value.strip()
+            anthropic_key = self._anthropic_input.value.strip()
+            openai_key = self._openai_input.value.strip()
+            ai_provider = self._provider_select.value
+            output_dir = self._output_dir_input.value.strip()
+            report_format = self._format_select.value
+            company_name = self._company_input.value.strip()
 
             # Update config
             if "api_keys" not in self.config:
@@ -231,100 +278,73 @@ class ConfigScreen(Screen):
 
             # Save to file
             if save_config(self.config):
-                status = self.query_one("#status", Static)
-                status.update("Configuration saved successfully!")
-                status.add_class("success")
-                status.remove_class("error")
-
-                self.notify("Configuration saved!", severity="information", timeout=3)
-
-                # Show equivalent CLI command
-                cli_cmds = []
-                if anthropic_key:
-                    cli_cmds.append("clausi config set --anthropic-key YOUR_KEY")
-                if ai_provider:
-                    cli_cmds.append(f"clausi config set --ai-provider {ai_provider}")
-
+                self._set_status(True, "Configuration saved successfully!")
+
+                # One toast with the equivalent CLI commands, if any
+                cli_cmds = "; ".join(cmd for cmd, used in (
+                    ("clausi config set --anthropic-key YOUR_KEY", anthropic_key),
+                    (f"clausi config set --ai-provider {ai_provider}", ai_provider),
+                ) if used)
+                message = "Configuration saved!"
                 if cli_cmds:
-                    self.notify(
-                        f"Equivalent CLI: {'; '.join(cli_cmds)}",
-                        severity="information",
-                        timeout=5
-                    )
+                    message += f"\nEquivalent CLI: {cli_cmds}"
+                self.notify(message, severity="information", timeout=5 if cli_cmds else 3)
             else:
                 raise Exception("Failed to save configuration file")
 
         except Exception as e:
-            status = self.query_one("#status", Static)
-            status.update(f"Error: {str(e)}")
-            status.add_class("error")
-            status.remove_class("success")
+            self._set_status(False, f"Error: {str(e)}")
             self.notify(f"Failed to save: {str(e)}", severity="error", timeout=5)
 
     def action_test(self) -> None:
-        """Test the API connection."""
-        anthropic_key = self.query_one("#anthropic-key", Input).value.strip()
-        openai_key = self.query_one("#openai-key", Input).value.strip()
-        ai_provider = self.query_one("#ai-provider", Select).value
-
-        if ai_provider == "claude":
-            if not anthropic_key:
-                self.notify("Please enter Anthropic API key first", severity="warning", timeout=3)
-                return
-
-            self.notify("Testing Anthropic API connection...", severity="information", timeout=2)
-
-            try:
-                # Test Anthropic API
-                from anthropic import Anthropic
-                client = Anthropic(api_key=anthropic_key)
-                # Make a minimal API call to test
-                # (This will raise an error if the key is invalid)
-                client.messages.create(
-                    model="claude-3-5-sonnet-20241022",
-                    max_tokens=10,
-                    messages=[{"role": "user", "content": "Hi"}]
-                )
-
-                status = self.query_one("#status", Static)
-                status.update("Anthropic API key is valid!")
-                status.add_class("success")
-                status.remove_class("error")
-                self.notify("Connection successful!", severity="information", timeout=3)
-
-            except Exception as e:
-                status = self.query_one("#status", Static)
-                status.update(f"API test failed: {str(e)}")
-                status.add_class("error")
-                status.remove_class("success")
-                self.notify(f"Connection failed: {str(e)}", severity="error", timeout=5)
-
-        elif ai_provider == "openai":
-            if not openai_key:
-                self.notify("Please enter OpenAI API key first", severity="warning", timeout=3)
+        """Test the API connection.
+
+        With both keys filled in, both providers are checked concurrently; otherwise
+        only the selected provider is.
+        """
+        anthropic_key = self._anthropic_input.value.strip()
+        openai_key = self._openai_input.value.strip()
+        ai_provider = self._provider_select.value
+
+        checks = {
+            "claude": ("Anthropic", anthropic_key, _anthropic_key_check),
+            "openai": ("OpenAI", openai_key, _openai_key_check),
+        }
+
+        if anthropic_key and openai_key:
+            providers = list(checks)
+        elif ai_provider in checks:
+            name, key, _ = checks[ai_provider]
+            if not key:
+                self.notify(f"Please enter {name} API key first", severity="warning", timeout=3)
                 return
-
-            self.notify("Testing OpenAI API connection...", severity="information", timeout=2)
-
+            providers = [ai_provider]
+        else:
+            return
+
+        names = " and ".join(checks[provider][0] for provider in providers)
+        self.notify(f"Testing {names} API connection...", severity="information", timeout=2)
+
+        # The network waits overlap, so checking both keys takes as long as the slower one
+        with ThreadPoolExecutor(max_workers=len(providers)) as pool:
+            futures = {
+                provider: pool.submit(checks[provider][2], checks[provider][1])
+                for provider in providers
+            }
+
+        failures = []
+        for provider, future in futures.items():
             try:
-                # Test OpenAI API
-                from openai import OpenAI
-                client = OpenAI(api_key=openai_key)
-                # Make a minimal API call to test
-                client.models.list()
-
-                status = self.query_one("#status", Static)
-                status.update("OpenAI API key is valid!")
-                status.add_class("success")
-                status.remove_class("error")
-                self.notify("Connection successful!", severity="information", timeout=3)
-
+                future.result()
             except Exception as e:
-                status = self.query_one("#status", Static)
-                status.update(f"API test failed: {str(e)}")
-                status.add_class("error")
-                status.remove_class("success")
-                self.notify(f"Connection failed: {str(e)}", severity="error", timeout=5)
+                failures.append(f"{checks[provider][0]}: {str(e)}")
+
+        if failures:
+            self._set_status(False, f"API test failed: {'; '.join(failures)}")
+            self.notify(f"Connection failed: {'; '.join(failures)}", severity="error", timeout=5)
+        else:
+            self._set_status(True, f"{names} API key{'s are' if len(providers) > 1 else ' is'} valid!")
+            self.notify("Connection successful!", severity="information", timeout=3)
 
     def action_cancel(self) -> None:
         """Cancel and go back."""
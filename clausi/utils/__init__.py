@@ -1,46 +1,40 @@
 """Utility functions and helpers."""
 
-from clausi.utils.config import (
-    load_config,
-    save_config,
-    get_config_path,
-    get_openai_key,
-    get_anthropic_key,
-    get_ai_provider,
-    get_ai_model,
-    get_api_token,
-    save_api_token,
-)
+import importlib
 
-from clausi.utils.output import (
-    open_in_editor,
-    display_markdown,
-    display_markdown_summary,
-    create_run_folder,
-    download_markdown_files,
-    display_findings_summary,
-    display_cache_statistics,
-    display_scan_progress,
-    create_enhanced_progress_bar,
-)
+# Public name -> submodule defining it; submodules are imported on first access (PEP 562)
+_EXPORTS = {
+    "load_config": "config",
+    "save_config": "config",
+    "get_config_path": "config",
+    "get_openai_key": "config",
+    "get_anthropic_key": "config",
+    "get_ai_provider": "config",
+    "get_ai_model": "config",
+    "get_api_token": "config",
+    "save_api_token": "config",
+    "open_in_editor": "output",
+    "display_markdown": "output",
+    "display_markdown_summary": "output",
+    "create_run_folder": "output",
+    "download_markdown_files": "output",
+    "display_findings_summary": "output",
+    "display_cache_statistics": "output",
+    "display_scan_progress": "output",
+    "create_enhanced_progress_bar": "output",
+}
 
-__all__ = [
-    "load_config",
-    "save_config",
-    "get_config_path",
-    "get_openai_key",
-    "get_anthropic_key",
-    "get_ai_provider",
-    "get_ai_model",
-    "get_api_token",
-    "save_api_token",
-    "open_in_editor",
-    "display_markdown",
-    "display_markdown_summary",
-    "create_run_folder",
-    "download_markdown_files",
-    "display_findings_summary",
-    "display_cache_statistics",
-    "display_scan_progress",
-    "create_enhanced_progress_bar",
-]
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    submodule = _EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{submodule}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
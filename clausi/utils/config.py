@@ -1,10 +1,14 @@
 """Configuration and token management."""
 
 import os
+import copy
+import stat
 import time
-import requests
+import tempfile
+import functools
+import threading
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import IO, Any, Callable, Dict, Optional
 import yaml
 from rich.table import Table
 from rich.panel import Panel
@@ -12,50 +16,119 @@ import click
 from clausi.utils.console import console
 
 # Constants
-CONFIG = Path.home() / ".clausi" / "credentials.yml"
+CONFIG_DIR = Path.home() / ".clausi"
+CONFIG = CONFIG_DIR / "credentials.yml"
+
+# Backend base URL; the environment does not change within a process
+_API_URL = os.environ.get("CLAUSI_TUNNEL_BASE", "https://api.clausi.ai")
+
+# libyaml's C loader/dumper when PyYAML was built with it, the pure-Python ones otherwise
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Parsed config.yml keyed by (st_mtime_ns, st_size); the TUI reads it from worker threads too
+_CONFIG_CACHE: Dict[str, Any] = {"key": None, "data": None}
+_CONFIG_LOCK = threading.Lock()
+
+# Shared HTTP session, created on first use (see get_http_session)
+_HTTP_SESSION = None
+
+# Keep-alive connections kept per host; at least the most threads that use the session
+# at once (regulations.UPLOAD_WORKERS uploads, three report downloads, the TUI key checks)
+HTTP_POOL_SIZE = 8
+
+@functools.lru_cache(maxsize=1)
+def _ensure_config_dir() -> Path:
+    """Create ~/.clausi once per process and return it."""
+    CONFIG_DIR.mkdir(exist_ok=True)
+    return CONFIG_DIR
 
 def get_config_path() -> Path:
     """Get the path to the config file."""
-    config_dir = Path.home() / ".clausi"
-    config_dir.mkdir(exist_ok=True)
-    return config_dir / "config.yml"
+    return _ensure_config_dir() / "config.yml"
 
 def get_credentials_path() -> Path:
     """Get the path to the credentials file."""
-    config_dir = Path.home() / ".clausi"
-    config_dir.mkdir(exist_ok=True)
-    return config_dir / "credentials.yml"
+    return _ensure_config_dir() / "credentials.yml"
+
+def _write_atomic(path: Path, write: Callable[[IO[str]], None], new_mode: int = 0o600) -> None:
+    """Serialize to a temporary sibling file with write(f), fsync it and rename it over path.
+
+    Readers see either the old or the new file, never a partially written one. A
+    symlinked path is written through to its target, and an existing file keeps its
+    permissions; a new one gets new_mode, owner-only by default since the files in
+    ~/.clausi hold API keys and tokens.
+    """
+    target = path.resolve()
+    try:
+        mode = stat.S_IMODE(os.stat(target).st_mode)
+    except FileNotFoundError:
+        mode = new_mode
+    # A unique name per save, so concurrent writers never share a temp file
+    fd, tmp_path = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, target)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def _write_yaml_atomic(path: Path, data: Dict[str, Any]) -> None:
+    """Atomically dump data as YAML to path (see _write_atomic); keys keep their insertion order."""
+    _write_atomic(path, lambda f: yaml.dump(data, f, Dumper=YAML_DUMPER, default_flow_style=False, sort_keys=False))
 
 def load_config() -> Optional[Dict[str, Any]]:
-    """Load configuration from file."""
+    """Load configuration from file.
+
+    The parsed file is cached until its modification time or size changes; each call
+    returns its own copy, so callers may modify it before passing it to save_config.
+    """
     config_path = get_config_path()
-    if not config_path.exists():
-        return None
-    
     try:
-        with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
-    except Exception as e:
-        console.print(f"[red]Error loading config: {e}[/red]")
+        st = os.stat(config_path)
+    except OSError:
         return None
+    key = (st.st_mtime_ns, st.st_size)
+
+    with _CONFIG_LOCK:
+        if _CONFIG_CACHE["key"] != key:
+            try:
+                with open(config_path, 'r') as f:
+                    data = yaml.load(f, Loader=YAML_LOADER)
+            except Exception as e:
+                console.print(f"[red]Error loading config: {e}[/red]")
+                return None
+            _CONFIG_CACHE["key"] = key
+            _CONFIG_CACHE["data"] = data
+        return copy.deepcopy(_CONFIG_CACHE["data"])
 
 def save_config(config: Dict[str, Any]) -> bool:
     """Save configuration to file."""
     config_path = get_config_path()
-    try:
-        with open(config_path, 'w') as f:
-            yaml.dump(config, f, default_flow_style=False)
-        return True
-    except Exception as e:
-        console.print(f"[red]Error saving config: {e}[/red]")
-        return False
+    with _CONFIG_LOCK:
+        _CONFIG_CACHE["key"] = None
+        try:
+            _write_yaml_atomic(config_path, config)
+            st = os.stat(config_path)
+        except Exception as e:
+            console.print(f"[red]Error saving config: {e}[/red]")
+            return False
+        _CONFIG_CACHE["key"] = (st.st_mtime_ns, st.st_size)
+        _CONFIG_CACHE["data"] = copy.deepcopy(config)
+    return True
 
 def save_token(token: str) -> bool:
     """Save token to credentials file."""
     try:
-        CONFIG.parent.mkdir(exist_ok=True)
-        with CONFIG.open("w") as f:
-            yaml.safe_dump({"api_token": token}, f)
+        _ensure_config_dir()
+        _write_yaml_atomic(CONFIG, {"api_token": token})
         return True
     except Exception as e:
         console.print(f"[red]Error saving token: {e}[/red]")
@@ -65,16 +138,38 @@ def load_token() -> Optional[str]:
     """Load token from credentials file."""
     try:
         if CONFIG.exists():
-            return yaml.safe_load(CONFIG.read_text()).get("api_token")
+            return yaml.load(CONFIG.read_text(), Loader=YAML_LOADER).get("api_token")
         return None
     except Exception as e:
         console.print(f"[yellow]Warning: Could not load credentials: {e}[/yellow]")
         return None
 
+def get_http_session():
+    """Return a shared requests.Session so API calls reuse pooled keep-alive connections.
+
+    Failed connection attempts are retried up to 3 times with exponential backoff. Requests
+    that reached the server are never resent, since a scan POST is not idempotent.
+    """
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        retries = Retry(total=3, connect=3, read=False, status=False, backoff_factor=0.3)
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=HTTP_POOL_SIZE, max_retries=retries)
+        session = requests.Session()
+        # Plain http:// too, for local and development backends
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _HTTP_SESSION = session
+    return _HTTP_SESSION
+
 def check_token_status(token: str, api_url: str) -> Optional[Dict[str, Any]]:
     """Check token status and remaining credits."""
+    import requests
     try:
-        response = requests.get(
+        response = get_http_session().get(
             f"{api_url}/api/clausi/token/status",
             headers={"Authorization": f"Bearer {token}"},
             timeout=10
@@ -103,15 +198,19 @@ def save_api_token(token: str):
     config['api_token'] = token
     return save_config(config)
 
-def get_openai_key() -> Optional[str]:
-    """Get OpenAI API key from environment or config."""
+def get_openai_key(config: Optional[Dict[str, Any]] = None) -> Optional[str]:
+    """Get OpenAI API key from environment or config.
+
+    Pass an already loaded config to avoid reading config.yml again.
+    """
     # First try environment variable
     openai_key = os.getenv('OPENAI_API_KEY')
     if openai_key:
         return openai_key
 
     # Then try config file
-    config = load_config()
+    if config is None:
+        config = load_config()
     if config:
         # Check new api_keys structure
         if config.get("api_keys", {}).get("openai"):
@@ -128,15 +227,19 @@ def get_openai_key() -> Optional[str]:
 
     return None
 
-def get_anthropic_key() -> Optional[str]:
-    """Get Anthropic API key from environment or config."""
+def get_anthropic_key(config: Optional[Dict[str, Any]] = None) -> Optional[str]:
+    """Get Anthropic API key from environment or config.
+
+    Pass an already loaded config to avoid reading config.yml again.
+    """
     # First try environment variable
     anthropic_key = os.getenv('ANTHROPIC_API_KEY')
     if anthropic_key:
         return anthropic_key
 
     # Then try config file
-    config = load_config()
+    if config is None:
+        config = load_config()
     if config:
         # Check new api_keys structure
         if config.get("api_keys", {}).get("anthropic"):
@@ -152,24 +255,52 @@ def get_ai_provider() -> str:
         return provider
     return "claude"
 
-def get_ai_model(provider: str = None) -> str:
-    """Get AI model for given provider from config."""
-    if not provider:
-        provider = get_ai_provider()
+def get_ai_model(provider: str = None, config: Optional[Dict[str, Any]] = None) -> str:
+    """Get AI model for given provider from config.
 
-    config = load_config()
-    if config:
-        # Check for provider-specific model in config
-        model = config.get("ai", {}).get("model")
-        if model:
-            return model
+    Pass an already loaded config to avoid reading config.yml again.
+    """
+    if config is None:
+        config = load_config()
+    # One config serves both the model override and the provider default
+    ai = (config or {}).get("ai", {})
+
+    # Check for provider-specific model in config
+    model = ai.get("model")
+    if model:
+        return model
 
     # Default models
-    if provider == "claude":
+    if (provider or ai.get("provider", "claude")) == "claude":
         return "claude-3-5-sonnet-20241022"
     else:  # openai
         return "gpt-4"
 
+def _credits_from(data: Dict[str, Any]) -> int:
+    """Credit count from a /api/users/me payload; older servers report it as "tokens"."""
+    if (credits := data.get("credits")) is not None:
+        return credits
+    return data.get("tokens", 0)
+
+def get_credit_balance() -> Optional[int]:
+    """Fetch the account's credit balance, or None without an account or when the server is unreachable."""
+    import requests
+    token = get_api_token()
+    if not token:
+        return None
+    try:
+        response = get_http_session().get(
+            f"{_API_URL}/api/users/me",
+            headers={"X-Clausi-Key": token},
+            timeout=10
+        )
+        if response.status_code != 200:
+            return None
+        data = response.json()
+        return _credits_from(data)
+    except (requests.exceptions.RequestException, ValueError):
+        return None
+
 def show_balance_status():
     """Show account balance status."""
     import requests
@@ -179,15 +310,14 @@ def show_balance_status():
 
         # Fetch balance from API
         try:
-            api_url = os.environ.get("CLAUSI_TUNNEL_BASE", "https://api.clausi.ai")
-            response = requests.get(
-                f"{api_url}/api/users/me",
+            response = get_http_session().get(
+                f"{_API_URL}/api/users/me",
                 headers={"X-Clausi-Key": token},
                 timeout=10
             )
             if response.status_code == 200:
                 data = response.json()
-                credits = data.get("credits", data.get("tokens", 0))
+                credits = _credits_from(data)
                 balance_usd = credits * 0.10
                 console.print(f"   Balance: [bold]${balance_usd:.2f}[/bold] ({credits} credits)")
             elif response.status_code == 401:
@@ -2,7 +2,9 @@
 
 from rich.console import Console
 
-# Singleton console instance with UTF-8 encoding for Windows
-console = Console(legacy_windows=False)
+# Singleton console instance with UTF-8 encoding for Windows. Automatic highlighting
+# of numbers, paths and URLs is off; markup tags still apply, and a single print can
+# opt back in with highlight=True.
+console = Console(legacy_windows=False, highlight=False)
 
 __all__ = ["console"]
@@ -1,12 +1,17 @@
 """Cross-platform emoji support with ASCII fallbacks for Windows."""
 
+import re
 import sys
 import platform
+import functools
 
 
+@functools.lru_cache(maxsize=None)
 def supports_emoji() -> bool:
     """Check if the current console supports emoji characters.
 
+    The answer is probed once per process and cached.
+
     Returns:
         bool: True if emoji is supported, False otherwise
     """
@@ -26,36 +31,80 @@ def supports_emoji() -> bool:
     return True
 
 
-# Emoji map with ASCII fallbacks
-EMOJI_MAP = {
+# Emoji and ASCII fallback for each name
+_RAW_EMOJI = {
     # Status indicators
-    "check": "✓" if supports_emoji() else "[OK]",
-    "cross": "✗" if supports_emoji() else "[X]",
-    "checkmark": "✅" if supports_emoji() else "[OK]",
-    "crossmark": "❌" if supports_emoji() else "[ERROR]",
-    "warning": "⚠️" if supports_emoji() else "[!]",
-    "info": "💡" if supports_emoji() else "[i]",
+    "check": ("✓", "[OK]"),
+    "cross": ("✗", "[X]"),
+    "checkmark": ("✅", "[OK]"),
+    "crossmark": ("❌", "[ERROR]"),
+    "warning": ("⚠️", "[!]"),
+    "info": ("💡", "[i]"),
 
     # Status colors
-    "red_circle": "🔴" if supports_emoji() else "[!]",
-    "yellow_circle": "🟡" if supports_emoji() else "[*]",
-    "green_circle": "🟢" if supports_emoji() else "[+]",
+    "red_circle": ("🔴", "[!]"),
+    "yellow_circle": ("🟡", "[*]"),
+    "green_circle": ("🟢", "[+]"),
 
     # Actions
-    "search": "🔍" if supports_emoji() else "[Search]",
-    "folder": "📁" if supports_emoji() else "[Folder]",
-    "file": "📄" if supports_emoji() else "[File]",
-    "clipboard": "📋" if supports_emoji() else "[List]",
-    "chart": "📊" if supports_emoji() else "[Chart]",
-    "credit_card": "💳" if supports_emoji() else "[Payment]",
-    "party": "🎉" if supports_emoji() else "[!]",
+    "search": ("🔍", "[Search]"),
+    "folder": ("📁", "[Folder]"),
+    "file": ("📄", "[File]"),
+    "clipboard": ("📋", "[List]"),
+    "chart": ("📊", "[Chart]"),
+    "credit_card": ("💳", "[Payment]"),
+    "party": ("🎉", "[!]"),
 
     # Numbers
-    "one": "1️⃣" if supports_emoji() else "1.",
-    "two": "2️⃣" if supports_emoji() else "2.",
-    "three": "3️⃣" if supports_emoji() else "3.",
+    "one": ("1️⃣", "1."),
+    "two": ("2️⃣", "2."),
+    "three": ("3️⃣", "3."),
 }
 
+_EMOJI_SUPPORTED = supports_emoji()
+
+# Emoji map with ASCII fallbacks, resolved for this console once at import
+EMOJI_MAP = {
+    name: emoji if _EMOJI_SUPPORTED else fallback
+    for name, (emoji, fallback) in _RAW_EMOJI.items()
+}
+
+# Direct names for hot call sites; get() remains for dynamic lookups
+CHECK = EMOJI_MAP["check"]
+CROSS = EMOJI_MAP["cross"]
+CHECKMARK = EMOJI_MAP["checkmark"]
+CROSSMARK = EMOJI_MAP["crossmark"]
+WARNING = EMOJI_MAP["warning"]
+INFO = EMOJI_MAP["info"]
+RED_CIRCLE = EMOJI_MAP["red_circle"]
+YELLOW_CIRCLE = EMOJI_MAP["yellow_circle"]
+GREEN_CIRCLE = EMOJI_MAP["green_circle"]
+SEARCH = EMOJI_MAP["search"]
+FOLDER = EMOJI_MAP["folder"]
+FILE = EMOJI_MAP["file"]
+CLIPBOARD = EMOJI_MAP["clipboard"]
+CHART = EMOJI_MAP["chart"]
+CREDIT_CARD = EMOJI_MAP["credit_card"]
+PARTY = EMOJI_MAP["party"]
+ONE = EMOJI_MAP["one"]
+TWO = EMOJI_MAP["two"]
+THREE = EMOJI_MAP["three"]
+
+# Emoji by Unicode block: the supplementary symbol planes, arrows, letterlike and
+# enclosed alphanumerics, misc technical, geometric shapes, misc symbols and dingbats,
+# misc symbols and arrows, a few stray emoji codepoints, plus the keycap, variation
+# selector and zero-width joiner that glue multi-codepoint emoji together
+_EMOJI_STRIP_RE = re.compile(
+    "["
+    "\U0001F000-\U0001FFFF"
+    "\u2100-\u214F\u2190-\u21FF\u2300-\u23FF\u2460-\u24FF\u25A0-\u25FF"
+    "\u2600-\u27BF\u2B00-\u2BFF"
+    "\u203C\u2049\u3030\u303D\u3297\u3299"
+    "\u20E3\uFE0F\u200D"
+    "]+"
+)
+_EMOJI_MIN_CHAR = "\u200D"
+
 
 def get(name: str, fallback: str = "") -> str:
     """Get emoji by name with automatic fallback for unsupported terminals.
@@ -84,22 +133,11 @@ def strip_emoji(text: str) -> str:
     Returns:
         str: Text with emoji removed
     """
-    if supports_emoji():
+    if _EMOJI_SUPPORTED:
+        return text
+
+    # max() scans in C; text below the lowest emoji codepoint needs no regex pass
+    if not text or max(text) < _EMOJI_MIN_CHAR:
         return text
 
-    # Simple emoji removal for safety
-    # This catches most common emoji ranges
-    import re
-    # Unicode emoji ranges
-    emoji_pattern = re.compile(
-        "["
-        "\U0001F600-\U0001F64F"  # emoticons
-        "\U0001F300-\U0001F5FF"  # symbols & pictographs
-        "\U0001F680-\U0001F6FF"  # transport & map symbols
-        "\U0001F1E0-\U0001F1FF"  # flags
-        "\U00002702-\U000027B0"
-        "\U000024C2-\U0001F251"
-        "]+",
-        flags=re.UNICODE
-    )
-    return emoji_pattern.sub('', text)
+    return _EMOJI_STRIP_RE.sub('', text)
@@ -2,15 +2,18 @@
 
 import os
 import sys
+import time
 import subprocess
+from itertools import islice
 from pathlib import Path
 from typing import Optional, List
-from rich.markdown import Markdown
-from rich.panel import Panel
 
-from clausi.utils.emoji import get as emoji
+from clausi.utils.emoji import CHECK, CHART
 from clausi.utils.console import console
 
+# Bytes per write when streaming downloaded reports to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
 
 def ensure_output_dir(path: str, output_dir: Optional[str] = None) -> Path:
     """Ensure output directory exists and return its path.
@@ -56,7 +59,7 @@ def open_in_editor(file_path: Path) -> bool:
             # Linux - try xdg-open
             subprocess.run(['xdg-open', str(file_path)], check=True)
 
-        console.print(f"[green]{emoji('check')} Opened {file_path.name} in default editor[/green]")
+        console.print(f"[green]{CHECK} Opened {file_path.name} in default editor[/green]")
         return True
 
     except Exception as e:
@@ -80,6 +83,9 @@ def display_markdown(file_path: Path, title: Optional[str] = None) -> None:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
 
+        from rich.markdown import Markdown
+        from rich.panel import Panel
+
         md = Markdown(content)
 
         if title:
@@ -103,15 +109,16 @@ def display_markdown_summary(file_path: Path, max_lines: int = 20) -> None:
         return
 
     try:
+        # Read only the first N lines; the rest is counted without being kept
         with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+            summary_content = ''.join(islice(f, max_lines))
+            remaining = sum(1 for _ in f)
 
-        # Take first N lines
-        summary_lines = lines[:max_lines]
-        summary_content = ''.join(summary_lines)
+        if remaining:
+            summary_content += f"\n\n... ({remaining} more lines)\n"
 
-        if len(lines) > max_lines:
-            summary_content += f"\n\n... ({len(lines) - max_lines} more lines)\n"
+        from rich.markdown import Markdown
+        from rich.panel import Panel
 
         md = Markdown(summary_content)
         console.print(Panel(
@@ -134,10 +141,8 @@ def create_run_folder(base_output_dir: Path, project_name: str) -> Path:
     Returns:
         Path to the created run folder
     """
-    from datetime import datetime
-
     # Create timestamp-based folder name
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     run_folder_name = f"{project_name}_{timestamp}"
 
     run_folder = base_output_dir / run_folder_name
@@ -165,7 +170,8 @@ def download_markdown_files(
     Returns:
         List of downloaded file paths
     """
-    import requests
+    from concurrent.futures import ThreadPoolExecutor
+    from clausi.utils.config import get_http_session
 
     markdown_files = [
         "findings.md",
@@ -173,28 +179,41 @@ def download_markdown_files(
         "action_plan.md"
     ]
 
+    session = get_http_session()
+    headers = {"Authorization": f"Bearer {api_key}"}
+
+    def fetch(filename: str):
+        """Stream one report to disk; returns (status code, saved path or None)."""
+        url = f"{api_url}/api/clausi/report/{run_id}/{filename}"
+        file_path = output_dir / filename
+
+        with session.get(url, headers=headers, timeout=30, stream=True) as response:
+            if response.status_code != 200:
+                return response.status_code, None
+
+            with open(file_path, 'wb') as f:
+                for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+            return response.status_code, file_path
+
+    # Fetch all reports at once over the shared keep-alive session
+    with ThreadPoolExecutor(max_workers=len(markdown_files)) as pool:
+        futures = {filename: pool.submit(fetch, filename) for filename in markdown_files}
+
     downloaded = []
 
-    for filename in markdown_files:
+    for filename, future in futures.items():
         try:
-            response = requests.get(
-                f"{api_url}/api/clausi/report/{run_id}/{filename}",
-                headers={"Authorization": f"Bearer {api_key}"},
-                timeout=30
-            )
-
-            if response.status_code == 200:
-                file_path = output_dir / filename
-                with open(file_path, 'wb') as f:
-                    f.write(response.content)
+            status_code, file_path = future.result()
 
+            if status_code == 200:
                 downloaded.append(file_path)
-                console.print(f"[green]{emoji('check')} Downloaded {filename}[/green]")
+                console.print(f"[green]{CHECK} Downloaded {filename}[/green]")
 
-            elif response.status_code == 404:
+            elif status_code == 404:
                 console.print(f"[dim]  {filename} not available[/dim]")
             else:
-                console.print(f"[yellow]⚠ Could not download {filename}: {response.status_code}[/yellow]")
+                console.print(f"[yellow]⚠ Could not download {filename}: {status_code}[/yellow]")
 
         except Exception as e:
             console.print(f"[red]✗ Error downloading {filename}: {e}[/red]")
@@ -240,7 +259,7 @@ def display_cache_statistics(cache_stats: dict) -> None:
     if not cache_stats:
         return
 
-    console.print(f"\n[bold cyan]{emoji('chart')} Cache Statistics[/bold cyan]")
+    console.print(f"\n[bold cyan]{CHART} Cache Statistics[/bold cyan]")
 
     table = Table(show_header=False, box=None)
     table.add_column("Metric", style="cyan")
@@ -286,32 +305,25 @@ def display_scan_progress(
         tokens_used: Tokens used so far (optional)
         estimated_cost: Estimated cost so far (optional)
     """
-    from rich.progress import Progress, BarColumn, TextColumn, TimeElapsedColumn
-
     # Truncate long file names
     if len(file_name) > 40:
         file_name = "..." + file_name[-37:]
 
-    status_text = f"[cyan]File {current_file}/{total_files}:[/cyan] {file_name}\n"
-    status_text += f"[yellow]Clause {current_clause}/{total_clauses}:[/yellow] {clause_id}"
+    cost_text = f"\n[dim]Cost: ${estimated_cost:.2f}[/dim]" if estimated_cost > 0 else ""
 
-    if estimated_cost > 0:
-        status_text += f"\n[dim]Cost: ${estimated_cost:.2f}[/dim]"
-
-    console.print(status_text)
+    console.print(
+        f"[cyan]File {current_file}/{total_files}:[/cyan] {file_name}\n"
+        f"[yellow]Clause {current_clause}/{total_clauses}:[/yellow] {clause_id}{cost_text}"
+    )
 
 
-def create_enhanced_progress_bar(description: str = "Processing..."):
-    """Create an enhanced progress bar with more visual elements.
+def _progress_columns() -> tuple:
+    """Columns for create_enhanced_progress_bar.
 
-    Args:
-        description: Description text for the progress bar
-
-    Returns:
-        Progress context manager with enhanced columns
+    Built fresh for each Progress: Rich columns cache rendered cells by task id, and task ids
+    restart at 0 in every Progress, so shared columns would show another bar's stale cells.
     """
     from rich.progress import (
-        Progress,
         SpinnerColumn,
         TextColumn,
         BarColumn,
@@ -320,12 +332,25 @@ def create_enhanced_progress_bar(description: str = "Processing..."):
         TimeElapsedColumn
     )
 
-    return Progress(
+    return (
         SpinnerColumn(spinner_name="line"),  # Use ASCII-safe spinner for Windows
         TextColumn("[bold blue]{task.description}"),
         BarColumn(complete_style="green", finished_style="bold green"),
         TaskProgressColumn(),
         TimeElapsedColumn(),
         TimeRemainingColumn(),
-        console=console
     )
+
+
+def create_enhanced_progress_bar(description: str = "Processing..."):
+    """Create an enhanced progress bar with more visual elements.
+
+    Args:
+        description: Description text for the progress bar
+
+    Returns:
+        Progress context manager with enhanced columns
+    """
+    from rich.progress import Progress
+
+    return Progress(*_progress_columns(), console=console)
@@ -2,23 +2,54 @@
 
 import logging
 import os
+import copy
 import json
 import time
-import requests
+import functools
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Tuple
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, List, Tuple
 from clausi.utils.console import console
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# libyaml's C loader when PyYAML was built with it, the pure-Python one otherwise
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 logger = logging.getLogger(__name__)
 
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON with orjson when installed, the standard library otherwise."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize indented JSON with orjson when installed, the standard library otherwise."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
 # Cache and custom regulation paths
 CACHE_FILE = Path.home() / ".clausi" / "regulations_cache.json"
 CUSTOM_REGULATIONS_DIR = Path.home() / ".clausi" / "custom_regulations"
 CACHE_TTL = 3600  # 1 hour in seconds
 
-# Fallback regulations if backend is unreachable
-FALLBACK_REGULATIONS = {
+# Parsed cache file kept in-process so one CLI run reads it at most every MEM_CACHE_TTL seconds
+MEM_CACHE_TTL = 30
+_MEM_CACHE: Dict[str, Any] = {"data": None, "loaded_at": 0.0}
+
+# Concurrent uploads in upload_custom_regulations
+UPLOAD_WORKERS = 4
+
+# Fallback regulations if backend is unreachable (read-only, so it can be shared without copies)
+FALLBACK_REGULATIONS = MappingProxyType({
     "EU-AIA": {
         "name": "EU AI Act",
         "description": "European Union Artificial Intelligence Act",
@@ -39,41 +70,59 @@ FALLBACK_REGULATIONS = {
         "name": "SOC 2",
         "description": "System and Organization Controls Type 2",
     },
-}
+})
 
 
-def _get_cache() -> Optional[Dict[str, Any]]:
-    """Load regulations from cache if valid."""
-    if not CACHE_FILE.exists():
-        return None
+def _read_cache_file() -> Optional[Dict[str, Any]]:
+    """Parse the cache file, remembering the result in-process for MEM_CACHE_TTL seconds."""
+    now = time.time()
+    if now - _MEM_CACHE["loaded_at"] < MEM_CACHE_TTL:
+        return _MEM_CACHE["data"]
 
+    cache = None
     try:
-        with open(CACHE_FILE, 'r') as f:
-            cache = json.load(f)
-
-        # Check if cache is still valid
-        if time.time() - cache.get('timestamp', 0) < CACHE_TTL:
-            return cache.get('regulations')
+        with open(CACHE_FILE, 'rb') as f:
+            cache = _json_loads(f.read())
     except Exception:
         pass
 
+    _MEM_CACHE["data"] = cache
+    _MEM_CACHE["loaded_at"] = now
+    return cache
+
+
+def _get_cache() -> Optional[Dict[str, Any]]:
+    """Load regulations from cache if valid."""
+    cache = _read_cache_file()
+    if not isinstance(cache, dict):
+        return None
+
+    # Check if cache is still valid
+    if time.time() - cache.get('timestamp', 0) < CACHE_TTL:
+        return cache.get('regulations')
+
     return None
 
 
 def _save_cache(regulations: Dict[str, Any]) -> None:
     """Save regulations to cache."""
+    cache = {
+        'timestamp': time.time(),
+        'regulations': regulations
+    }
     try:
         CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(CACHE_FILE, 'w') as f:
-            json.dump({
-                'timestamp': time.time(),
-                'regulations': regulations
-            }, f, indent=2)
+        with open(CACHE_FILE, 'wb') as f:
+            f.write(_json_dumps(cache))
     except Exception as e:
         logger.warning(f"Failed to cache regulation: {e}")
+        return
 
+    _MEM_CACHE["data"] = cache
+    _MEM_CACHE["loaded_at"] = time.time()
 
-def get_regulations(api_url: Optional[str] = None, use_cache: bool = True) -> Dict[str, Any]:
+
+def get_regulations(api_url: Optional[str] = None, use_cache: bool = True) -> Mapping[str, Any]:
     """Fetch available regulations from backend with caching.
 
     Args:
@@ -81,13 +130,13 @@ def get_regulations(api_url: Optional[str] = None, use_cache: bool = True) -> Di
         use_cache: Whether to use cached regulations (default: True)
 
     Returns:
-        Dictionary of regulations {code: {name, description}}
+        Read-only mapping of regulations {code: {name, description}}
     """
     # Try cache first if enabled - this is instant
     if use_cache:
         cached = _get_cache()
         if cached:
-            return cached
+            return MappingProxyType(cached)
 
     # No cache - use FALLBACK_REGULATIONS immediately for fast startup
     # The backend will be called during the actual scan anyway
@@ -101,6 +150,8 @@ def get_regulations(api_url: Optional[str] = None, use_cache: bool = True) -> Di
     if not api_url:
         api_url = os.getenv('CLAUSI_TUNNEL_BASE') or "https://api.clausi.ai"
 
+    import requests
+
     try:
         response = requests.get(
             f"{api_url}/api/clausi/regulations",
@@ -120,7 +171,7 @@ def get_regulations(api_url: Optional[str] = None, use_cache: bool = True) -> Di
 
             # Save to cache for future use
             _save_cache(regulations)
-            return regulations
+            return MappingProxyType(regulations)
 
     except Exception:
         pass
@@ -129,9 +180,29 @@ def get_regulations(api_url: Optional[str] = None, use_cache: bool = True) -> Di
     return FALLBACK_REGULATIONS
 
 
+def _dir_mtime_ns(directory: Path) -> Optional[int]:
+    """Modification time of a directory, or None when it does not exist."""
+    try:
+        return os.stat(directory).st_mtime_ns
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=32)
+def _scan_regulations_dir(directory: str, mtime_ns: int) -> Tuple[Tuple[str, Path], ...]:
+    """List (code, path) pairs for *.yml files in a directory; mtime_ns keys the cache."""
+    # Use filename (without extension) as regulation code
+    return tuple(
+        (yaml_file.stem.upper().replace("_", "-"), yaml_file)
+        for yaml_file in Path(directory).glob("*.yml")
+    )
+
+
 def discover_custom_regulations(project_path: Optional[Path] = None) -> Dict[str, Path]:
     """Discover custom regulation YAML files from user's config directory AND project directory.
 
+    Directory listings are cached until the directory's modification time changes.
+
     Args:
         project_path: Optional path to project directory (will check .clausi/regulations/)
 
@@ -142,28 +213,47 @@ def discover_custom_regulations(project_path: Optional[Path] = None) -> Dict[str
     custom_regs = {}
 
     # 1. Check global custom regulations directory (~/.clausi/custom_regulations/)
-    if CUSTOM_REGULATIONS_DIR.exists():
-        for yaml_file in CUSTOM_REGULATIONS_DIR.glob("*.yml"):
-            # Use filename (without extension) as regulation code
-            reg_code = yaml_file.stem.upper().replace("_", "-")
-            custom_regs[reg_code] = yaml_file
+    mtime_ns = _dir_mtime_ns(CUSTOM_REGULATIONS_DIR)
+    if mtime_ns is not None:
+        custom_regs.update(_scan_regulations_dir(str(CUSTOM_REGULATIONS_DIR), mtime_ns))
 
     # 2. Check project-specific custom regulations (.clausi/regulations/)
     if project_path:
-        project_regs_dir = project_path / ".clausi" / "regulations"
-        if project_regs_dir.exists():
-            for yaml_file in project_regs_dir.glob("*.yml"):
-                # Use filename (without extension) as regulation code
-                reg_code = yaml_file.stem.upper().replace("_", "-")
-                # Project-specific regulations override global ones
-                custom_regs[reg_code] = yaml_file
+        project_regs_dir = Path(project_path) / ".clausi" / "regulations"
+        mtime_ns = _dir_mtime_ns(project_regs_dir)
+        if mtime_ns is not None:
+            # Project-specific regulations override global ones
+            custom_regs.update(_scan_regulations_dir(str(project_regs_dir), mtime_ns))
 
     return custom_regs
 
 
+@functools.lru_cache(maxsize=64)
+def _read_regulation_file(yaml_path: str, mtime_ns: int) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """Read and parse a regulation YAML file in one pass; mtime_ns keys the cache so edits are picked up.
+
+    Returns (raw text, parsed content or None if the YAML is invalid). Raises OSError
+    when the file cannot be read, which is not cached.
+    """
+    with open(yaml_path, 'r') as f:
+        text = f.read()
+    try:
+        return text, yaml.load(text, Loader=YAML_LOADER)
+    except Exception as e:
+        console.print(f"[yellow]Warning: Could not load custom regulation {os.path.basename(yaml_path)}: {e}[/yellow]")
+        return text, None
+
+
+def _regulation_file(yaml_path: Path) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """Cached (raw text, parsed content) of a regulation file; raises OSError if it is unreadable."""
+    return _read_regulation_file(os.fspath(yaml_path), os.stat(yaml_path).st_mtime_ns)
+
+
 def load_custom_regulation(yaml_path: Path) -> Optional[Dict[str, Any]]:
     """Load a custom regulation YAML file.
 
+    Parsed files are cached per modification time; each call returns its own copy.
+
     Args:
         yaml_path: Path to the YAML file
 
@@ -171,14 +261,42 @@ def load_custom_regulation(yaml_path: Path) -> Optional[Dict[str, Any]]:
         Parsed YAML content as dictionary, or None if invalid
     """
     try:
-        with open(yaml_path, 'r') as f:
-            return yaml.safe_load(f)
-    except Exception as e:
+        _, reg_data = _regulation_file(yaml_path)
+    except OSError as e:
         console.print(f"[yellow]Warning: Could not load custom regulation {yaml_path.name}: {e}[/yellow]")
         return None
 
+    return copy.deepcopy(reg_data)
+
+
+def get_regulation_index(project_path: Optional[Path] = None) -> Dict[str, Tuple[str, bool]]:
+    """Flat view of every selectable regulation, built-in ones first.
+
+    Built on the cached regulation list and the mtime-keyed custom regulation caches.
+
+    Args:
+        project_path: Optional path to project directory (will check .clausi/regulations/)
+
+    Returns:
+        Dictionary mapping regulation code to (display name, is_custom)
+    """
+    index = {
+        code: (info.get("name", code) if isinstance(info, dict) else code, False)
+        for code, info in get_regulations().items()
+    }
+
+    for code, yaml_path in discover_custom_regulations(project_path=project_path).items():
+        try:
+            _, reg_data = _regulation_file(yaml_path)
+        except OSError:
+            reg_data = None
+        name = reg_data.get('name', code) if isinstance(reg_data, dict) else code
+        index[code] = (name, True)
+
+    return index
 
-def get_all_regulations() -> Tuple[Dict[str, Any], Dict[str, Path]]:
+
+def get_all_regulations() -> Tuple[Mapping[str, Any], Dict[str, Path]]:
     """Get both built-in and custom regulations.
 
     Returns:
@@ -238,37 +356,51 @@ def upload_custom_regulations(
         api_url: Backend API URL
         customer_id: Customer ID for tracking (default: "cli_user")
     """
+    from concurrent.futures import ThreadPoolExecutor
+    from clausi.utils.config import get_http_session
+
     custom_regs_paths = discover_custom_regulations(project_path=project_path)
 
+    # Read YAML content
+    uploads = []
     for reg_code in selected_regulations:
         if reg_code in custom_regs_paths:
             yaml_path = custom_regs_paths[reg_code]
-
-            # Read YAML content
             try:
-                with open(yaml_path, 'r') as f:
-                    yaml_content = f.read()
+                # Same cached read that get_custom_regulations_for_scan parses from
+                uploads.append((reg_code, _regulation_file(yaml_path)[0]))
             except Exception as e:
                 console.print(f"[yellow]Warning: Could not read {yaml_path.name}: {e}[/yellow]")
-                continue
 
-            # Upload to backend
-            try:
-                response = requests.post(
-                    f"{api_url}/api/clausi/regulations/custom",
-                    json={
-                        "regulation_id": reg_code,
-                        "yaml_content": yaml_content,
-                        "customer_id": customer_id
-                    },
-                    timeout=10
-                )
-
-                if response.status_code == 200:
-                    console.print(f"[green]✓[/green] Uploaded custom regulation: {reg_code}")
-                else:
-                    error_msg = response.json().get("detail", "Unknown error")
-                    console.print(f"[yellow]Warning: Failed to upload {reg_code}: {error_msg}[/yellow]")
+    if not uploads:
+        return
 
-            except Exception as e:
-                console.print(f"[yellow]Warning: Could not upload {reg_code}: {e}[/yellow]")
+    session = get_http_session()
+
+    def upload(reg_code: str, yaml_content: str):
+        return session.post(
+            f"{api_url}/api/clausi/regulations/custom",
+            json={
+                "regulation_id": reg_code,
+                "yaml_content": yaml_content,
+                "customer_id": customer_id
+            },
+            timeout=10
+        )
+
+    # Upload to backend, all regulations at once over the shared keep-alive session
+    with ThreadPoolExecutor(max_workers=min(len(uploads), UPLOAD_WORKERS)) as pool:
+        futures = [(reg_code, pool.submit(upload, reg_code, yaml_content)) for reg_code, yaml_content in uploads]
+
+    for reg_code, future in futures:
+        try:
+            response = future.result()
+
+            if response.status_code == 200:
+                console.print(f"[green]✓[/green] Uploaded custom regulation: {reg_code}")
+            else:
+                error_msg = response.json().get("detail", "Unknown error")
+                console.print(f"[yellow]Warning: Failed to upload {reg_code}: {error_msg}[/yellow]")
+
+        except Exception as e:
+            console.print(f"[yellow]Warning: Could not upload {reg_code}: {e}[/yellow]")
@@ -0,0 +1,180 @@
+"""Tests for scan helpers in clausi.cli."""
+
+import json
+import os
+
+import pytest
+
+from clausi.cli import _FILES_PLACEHOLDER, _discover_and_filter_files, _encode_scan_payload
+
+
+@pytest.fixture
+def duplicated_project(tmp_path):
+    """A project where two files share the same content."""
+    root = tmp_path / "project"
+    (root / "a").mkdir(parents=True)
+    (root / "b").mkdir()
+    (root / "a" / "same.py").write_text("x = 1\n", encoding="utf-8")
+    (root / "b" / "same.py").write_text("x = 1\n", encoding="utf-8")
+    (root / "other.py").write_text("y = 2\n", encoding="utf-8")
+    return root
+
+
+def _paths(files):
+    return sorted(file_info["path"].replace("\\", "/") for file_info in files)
+
+
+def test_duplicates_are_sent_unless_dedupe_is_enabled(duplicated_project):
+    files = _discover_and_filter_files(str(duplicated_project), None)
+
+    assert _paths(files) == ["a/same.py", "b/same.py", "other.py"]
+    assert not any("aliases" in file_info for file_info in files)
+
+
+def test_deduped_aliases_reach_the_scan_payload(duplicated_project):
+    files = _discover_and_filter_files(str(duplicated_project), None, dedupe=True)
+    data = {"metadata": {"files": _FILES_PLACEHOLDER}, "estimate_only": False}
+
+    body = json.loads(_encode_scan_payload(data, json.dumps(files)))
+
+    sent = body["metadata"]["files"]
+    assert len(sent) == 2
+    aliased = [file_info for file_info in sent if "aliases" in file_info]
+    assert len(aliased) == 1
+    # Walk order decides which copy is kept; the other one must be listed as its alias
+    paths = {aliased[0]["path"].replace("\\", "/")} | {p.replace("\\", "/") for p in aliased[0]["aliases"]}
+    assert paths == {"a/same.py", "b/same.py"}
+
+
+def test_early_exit_stops_background_discovery(tmp_path, monkeypatch):
+    import sys
+    import threading
+
+    from clausi.cli import main
+    from clausi.core import scanner
+
+    cli_module = sys.modules["clausi.cli"]
+    monkeypatch.setattr(cli_module, "load_config", lambda: {})
+    monkeypatch.setattr(cli_module.config_module, "get_anthropic_key", lambda config=None: None)
+
+    cancels = []
+
+    def slow_scan(path, cancel=None, **kwargs):
+        # Stands in for a large tree: only returns once the scan is cancelled
+        cancels.append(cancel)
+        cancel.wait(10)
+        return []
+
+    monkeypatch.setattr(scanner, "scan_directory", slow_scan)
+
+    # --claude without an Anthropic key exits before the files are needed
+    assert main(["scan", str(tmp_path), "--claude", "claude-3-5-sonnet-20241022"]) == 1
+
+    assert cancels and cancels[0].is_set()
+    assert not any(thread.name == "clausi-discovery" for thread in threading.enumerate())
+
+
+def test_scan_reads_the_config_once(tmp_path, monkeypatch):
+    import sys
+
+    from clausi.cli import main
+
+    cli_module = sys.modules["clausi.cli"]
+    loads = []
+
+    def load_config():
+        loads.append(1)
+        return {"api_keys": {"anthropic": "sk-ant-test"}, "ai": {"model": "claude-test"},
+                "regulations": {"selected": ["EU-AIA"]}}
+
+    monkeypatch.setattr(cli_module.config_module, "load_config", load_config)
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    monkeypatch.delenv("CLAUSI_TUNNEL_BASE", raising=False)
+    seen = {}
+
+    def stop(select_clauses, include_clauses, exclude_clauses, preset, regulations):
+        seen["regulations"] = regulations
+        sys.exit(3)
+
+    monkeypatch.setattr(cli_module, "_setup_clause_scoping", stop)
+
+    assert main(["scan", str(tmp_path), "--claude", ""]) == 3
+
+    assert seen["regulations"] == ["EU-AIA"]
+    assert len(loads) == 1
+
+
+def test_cancelled_scan_stops_walking(tmp_path):
+    import threading
+
+    from clausi.core import scanner
+
+    for i in range(5):
+        (tmp_path / f"m{i}.py").write_text("x = 1\n", encoding="utf-8")
+    cancel = threading.Event()
+    cancel.set()
+
+    assert scanner.scan_directory(str(tmp_path), cancel=cancel) == []
+
+
+def test_editor_command_keeps_quoted_windows_paths(tmp_path):
+    from clausi.cli import _editor_command
+
+    editor = r'"C:\Program Files\Notepad++\notepad++.exe" -multiInst'
+    config = tmp_path / "my config.yml"
+
+    assert _editor_command(editor, config, windows=True) == f'{editor} "{config}"'
+
+
+def test_editor_command_splits_posix_editor_arguments(tmp_path):
+    from clausi.cli import _editor_command
+
+    config = tmp_path / "my config.yml"
+
+    assert _editor_command("code --wait", config, windows=False) == ["code", "--wait", str(config)]
+
+
+def test_missing_editor_is_reported(tmp_path, monkeypatch, capsys):
+    import sys
+
+    from clausi.cli import main
+
+    monkeypatch.setenv("EDITOR", "clausi-no-such-editor")
+    monkeypatch.setattr(sys.modules["clausi.cli"].config_module, "_ensure_config_dir", lambda: tmp_path)
+
+    assert main(["config", "edit"]) == 0
+    assert "Could not start editor" in capsys.readouterr().out
+
+
+def test_validated_keys_cache_survives_a_failed_write(tmp_path, monkeypatch):
+    from clausi.cli import _load_validated_keys, _save_validated_keys
+    from clausi.utils import config as config_module
+
+    monkeypatch.setattr(config_module, "_ensure_config_dir", lambda: tmp_path)
+    _save_validated_keys({"abc": 1.0})
+    assert (tmp_path / "validated_keys.json").exists()
+
+    # json.dump fails part-way through; the previous cache must stay readable
+    _save_validated_keys({"def": 2.0, "bad": object()})
+
+    assert _load_validated_keys() == {"abc": 1.0}
+    assert sorted(os.listdir(tmp_path)) == ["validated_keys.json"]
+
+
+def test_default_config_keeps_section_order(tmp_path, monkeypatch):
+    import yaml
+
+    from clausi.cli import create_default_config
+    from clausi.utils import config as config_module
+
+    monkeypatch.setattr(config_module, "_ensure_config_dir", lambda: tmp_path)
+
+    create_default_config()
+
+    text = (tmp_path / "config.yml").read_text()
+    sections = [line.split(":")[0] for line in text.splitlines() if line and not line.startswith(" ")]
+    # Written in the order the defaults are declared, not sorted alphabetically
+    assert sections[:2] == ["api_key", "ai"]
+    assert sections != sorted(sections)
+    assert yaml.safe_load(text)["ai"]["provider"] == "claude"
+    assert sorted(os.listdir(tmp_path)) == ["config.yml"]
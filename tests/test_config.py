@@ -0,0 +1,81 @@
+"""Tests for clausi.utils.config."""
+
+import os
+import stat
+
+import pytest
+import yaml
+
+from clausi.utils import config as config_module
+
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    """Point the config and credentials files at a temporary directory."""
+    directory = tmp_path / ".clausi"
+    directory.mkdir()
+    monkeypatch.setattr(config_module, "_ensure_config_dir", lambda: directory)
+    monkeypatch.setattr(config_module, "CONFIG", directory / "credentials.yml")
+    monkeypatch.setitem(config_module._CONFIG_CACHE, "key", None)
+    return directory
+
+
+def _mode(path):
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+def test_save_config_keeps_existing_mode(config_dir):
+    config_path = config_dir / "config.yml"
+    config_path.write_text("api_keys: {}\n")
+    os.chmod(config_path, 0o640)
+
+    assert config_module.save_config({"api_keys": {"anthropic": "sk-test"}})
+
+    assert _mode(config_path) == 0o640
+    assert config_module.load_config() == {"api_keys": {"anthropic": "sk-test"}}
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+def test_new_credentials_file_is_owner_only(config_dir):
+    assert config_module.save_token("tok")
+
+    assert _mode(config_dir / "credentials.yml") == 0o600
+    assert config_module.load_token() == "tok"
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="needs symlink support")
+def test_save_config_writes_through_symlink(config_dir, tmp_path):
+    dotfiles = tmp_path / "dotfiles"
+    dotfiles.mkdir()
+    real = dotfiles / "config.yml"
+    real.write_text("ui: {}\n")
+    os.chmod(real, 0o600)
+    link = config_dir / "config.yml"
+    try:
+        os.symlink(real, link)
+    except OSError:
+        pytest.skip("cannot create symlinks here")
+
+    assert config_module.save_config({"ui": {"theme": "dark"}})
+
+    assert link.is_symlink()
+    assert yaml.safe_load(real.read_text()) == {"ui": {"theme": "dark"}}
+    if os.name != "nt":
+        assert _mode(real) == 0o600
+    # No temporary files are left behind in either directory
+    assert sorted(os.listdir(dotfiles)) == ["config.yml"]
+    assert sorted(os.listdir(config_dir)) == ["config.yml"]
+
+
+def test_http_session_pools_both_schemes(monkeypatch):
+    from clausi.utils import regulations
+
+    monkeypatch.setattr(config_module, "_HTTP_SESSION", None)
+    session = config_module.get_http_session()
+
+    http = session.get_adapter("http://localhost:8000/api")
+    https = session.get_adapter("https://api.clausi.ai/api")
+    assert http is https
+    assert http.max_retries.connect == 3
+    assert http._pool_maxsize >= regulations.UPLOAD_WORKERS
@@ -0,0 +1,106 @@
+"""Tests for clausi.core.darwin_walk that do not need macOS."""
+
+import os
+import struct
+import sys
+
+import pytest
+
+from clausi.core import darwin_walk
+
+
+def _entry(name, obj_type=None, size=None, error=None, with_name=True):
+    """Pack one getattrlistbulk entry with only the given attributes returned."""
+    commonattr = darwin_walk.ATTR_CMN_RETURNED_ATTRS
+    fileattr = 0
+    fields = b""
+    if error is not None:
+        commonattr |= darwin_walk.ATTR_CMN_ERROR
+        fields += struct.pack("<I", error)
+    name_field = len(fields)
+    if with_name:
+        commonattr |= darwin_walk.ATTR_CMN_NAME
+        fields += b"\0" * 8
+    if obj_type is not None:
+        commonattr |= darwin_walk.ATTR_CMN_OBJTYPE
+        fields += struct.pack("<I", obj_type)
+    if size is not None:
+        fileattr |= darwin_walk.ATTR_FILE_DATALENGTH
+        fields += struct.pack("<q", size)
+    if with_name:
+        encoded = os.fsencode(name) + b"\0"
+        reference = struct.pack("<iI", len(fields) - name_field, len(encoded))
+        fields = fields[:name_field] + reference + fields[name_field + 8:] + encoded
+    header = struct.pack("<5I", commonattr, 0, 0, fileattr, 0)
+    return struct.pack("<I", 4 + len(header) + len(fields)) + header + fields
+
+
+def test_walker_is_opt_in(monkeypatch):
+    monkeypatch.setattr(darwin_walk, "_libsystem", lambda: object())
+    monkeypatch.delenv("CLAUSI_DARWIN_BULK", raising=False)
+    assert not darwin_walk.available()
+
+    monkeypatch.setenv("CLAUSI_DARWIN_BULK", "1")
+    assert darwin_walk.available()
+
+
+def test_parse_entries_follows_returned_attributes(tmp_path):
+    (tmp_path / "untyped").mkdir()
+    raw = b"".join([
+        _entry("a.py", darwin_walk.VREG, size=42),
+        _entry("sub", darwin_walk.VDIR),
+        _entry("failed.py", darwin_walk.VREG, size=1, error=13),
+        _entry("", darwin_walk.VREG, size=7, with_name=False),
+        # No OBJTYPE returned: the type comes from lstat instead of the next field
+        _entry("untyped"),
+        _entry("b.py", darwin_walk.VREG, size=3, error=0),
+    ])
+    fd = os.open(tmp_path, os.O_RDONLY)
+    try:
+        entries = darwin_walk._parse_entries(raw, 6, str(tmp_path), fd)
+    finally:
+        os.close(fd)
+
+    assert entries == [("a.py", False, 42), ("sub", True, None), ("untyped", True, None), ("b.py", False, 3)]
+
+
+@pytest.fixture
+def low_recursion_limit():
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(200)
+    yield 200
+    sys.setrecursionlimit(limit)
+
+
+@pytest.mark.skipif(not hasattr(os, "O_DIRECTORY"), reason="needs O_DIRECTORY")
+def test_deep_tree_does_not_recurse(tmp_path, monkeypatch, low_recursion_limit):
+    monkeypatch.setattr(darwin_walk, "_list_bulk", lambda top, dirfd: None)
+    expected = []
+    path = str(tmp_path)
+    for _ in range(low_recursion_limit + 100):
+        expected.append((path, ["d"], []))
+        path = os.path.join(path, "d")
+        os.mkdir(path)
+    with open(os.path.join(path, "leaf.py"), "w") as f:
+        f.write("x = 1\n")
+    expected.append((path, [], ["leaf.py"]))
+
+    walked = [(root, dirs, [name for name, _ in files])
+              for root, dirs, files, _ in darwin_walk.darwin_walk(str(tmp_path))]
+
+    assert walked == expected
+
+
+@pytest.mark.skipif(not hasattr(os, "O_DIRECTORY"), reason="needs O_DIRECTORY")
+def test_pruned_directories_are_not_walked(tmp_path, monkeypatch):
+    monkeypatch.setattr(darwin_walk, "_list_bulk", lambda top, dirfd: None)
+    for name in ("a", "skip", "z"):
+        (tmp_path / name / "inner").mkdir(parents=True)
+
+    roots = []
+    for root, dirs, _, _ in darwin_walk.darwin_walk(str(tmp_path)):
+        dirs.sort()
+        dirs[:] = [d for d in dirs if d != "skip"]
+        roots.append(os.path.relpath(root, tmp_path))
+
+    assert roots == [".", "a", os.path.join("a", "inner"), "z", os.path.join("z", "inner")]
@@ -0,0 +1,39 @@
+"""Tests for clausi.utils.emoji."""
+
+import re
+
+import pytest
+
+from clausi.utils import emoji
+
+# The pattern strip_emoji used before it was narrowed to Unicode blocks
+_BASELINE_RE = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"
+    "\U0001F300-\U0001F5FF"
+    "\U0001F680-\U0001F6FF"
+    "\U0001F1E0-\U0001F1FF"
+    "\U00002702-\U000027B0"
+    "\U000024C2-\U0001F251"
+    "]+"
+)
+
+
+@pytest.fixture
+def legacy_console(monkeypatch):
+    monkeypatch.setattr(emoji, "_EMOJI_SUPPORTED", False)
+
+
+@pytest.mark.parametrize("char", ["⭐", "▶", "‼", "™", "Ⓜ", "⁉", "〰",
+                                  "〽", "㊗", "㊙", "↔", "✅", "\U0001F600"])
+def test_strip_emoji_removes_symbols(legacy_console, char):
+    text = f"Done {char}️ now"
+
+    assert emoji.strip_emoji(text) == "Done  now"
+    # Everything the baseline pattern removed is still removed
+    if _BASELINE_RE.search(char):
+        assert emoji.strip_emoji(text) == _BASELINE_RE.sub("", text)
+
+
+def test_strip_emoji_keeps_plain_text(legacy_console):
+    assert emoji.strip_emoji("café – résumé") == "café – résumé"
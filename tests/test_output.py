@@ -0,0 +1,54 @@
+"""Tests for clausi.utils.output."""
+
+from clausi.utils import config as config_module
+from clausi.utils import output
+
+
+class _FakeResponse:
+    def __init__(self, status_code, body=b""):
+        self.status_code = status_code
+        self._body = body
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self._body), chunk_size):
+            yield self._body[start:start + chunk_size]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _FakeSession:
+    def __init__(self, reports):
+        self.reports = reports
+        self.requests = []
+
+    def get(self, url, headers=None, **kwargs):
+        self.requests.append((url, headers))
+        name = url.rsplit("/", 1)[1]
+        if name in self.reports:
+            return _FakeResponse(200, self.reports[name])
+        return _FakeResponse(404)
+
+
+def test_download_markdown_files_streams_available_reports(tmp_path, monkeypatch):
+    body = b"# Findings\n" + b"x" * (output.DOWNLOAD_CHUNK_SIZE + 10)
+    session = _FakeSession({"findings.md": body, "action_plan.md": b"# Plan\n"})
+    monkeypatch.setattr(config_module, "get_http_session", lambda: session)
+
+    downloaded = output.download_markdown_files("https://api.test", "run-1", tmp_path, "key")
+
+    assert sorted(path.name for path in downloaded) == ["action_plan.md", "findings.md"]
+    assert (tmp_path / "findings.md").read_bytes() == body
+    assert not (tmp_path / "traceability.md").exists()
+    # Plain downloads: every run has a new run_id, so there is nothing to revalidate
+    assert all("If-None-Match" not in headers for _, headers in session.requests)
+
+
+def test_progress_bars_do_not_share_columns():
+    first = output.create_enhanced_progress_bar()
+    second = output.create_enhanced_progress_bar()
+
+    assert not set(map(id, first.columns)) & set(map(id, second.columns))
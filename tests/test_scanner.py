@@ -0,0 +1,224 @@
+"""Tests for clausi.core.scanner."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from clausi.core import scanner
+
+
+def _write(path, text="x = 1\n"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+@pytest.fixture
+def project(tmp_path):
+    """A small project tree with a few source files in nested directories."""
+    root = tmp_path / "project"
+    _write(root / "main.py", "print('hi')\n")
+    _write(root / "pkg" / "__init__.py", "")
+    _write(root / "pkg" / "util.js", "export const a = 1;\n")
+    _write(root / "pkg" / "deep" / "mod.go", "package deep\n")
+    _write(root / "README.md", "# not scanned\n")
+    return root
+
+
+def _paths(files):
+    return sorted(file_info["path"].replace(os.sep, "/") for file_info in files)
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="needs symlink support")
+def test_symlinked_root_is_scanned(project, tmp_path):
+    link = tmp_path / "link"
+    try:
+        os.symlink(project, link, target_is_directory=True)
+    except OSError:
+        pytest.skip("cannot create symlinks here")
+
+    files = scanner.scan_directory(str(link))
+
+    assert _paths(files) == _paths(scanner.scan_directory(str(project)))
+    assert _paths(files) == ["main.py", "pkg/__init__.py", "pkg/deep/mod.go", "pkg/util.js"]
+
+
+@pytest.mark.skipif(scanner.pathspec is None, reason="needs pathspec")
+def test_clausiignore_created_after_a_lookup_is_found(tmp_path):
+    root = tmp_path / "repo"
+    (root / ".git").mkdir(parents=True)
+    project = root / "service"
+    project.mkdir()
+
+    assert scanner.find_clausiignore_file(str(project)) is None
+
+    (root / ".clausiignore").write_text("*.log\n", encoding="utf-8")
+    assert scanner.find_clausiignore_file(str(project)) == root / ".clausiignore"
+
+    # A nearer file added later takes over from the cached one
+    (project / ".clausiignore").write_text("tests/\n", encoding="utf-8")
+    assert scanner.find_clausiignore_file(str(project)) == project / ".clausiignore"
+
+    (project / ".clausiignore").unlink()
+    assert scanner.find_clausiignore_file(str(project)) == root / ".clausiignore"
+
+
+def test_scan_and_analyze_hands_paths_to_workers_without_reading(project, monkeypatch):
+    def no_reads(*args, **kwargs):
+        raise AssertionError("scan_and_analyze must not read files in the parent")
+
+    monkeypatch.setattr(scanner, "_read_fd", no_reads)
+
+    sizes = scanner.scan_and_analyze(str(project), os.path.getsize, procs=2)
+
+    expected = [os.path.getsize(project / rel) for rel in
+                ("main.py", "pkg/__init__.py", "pkg/util.js", "pkg/deep/mod.go")]
+    assert sorted(sizes) == sorted(expected)
+
+
+def _baseline_scan_directory(path):
+    """The os.walk scanner the rewrites replaced, kept as the reference for their output."""
+    files_to_analyze = []
+    path = Path(path)
+    extensions = {'.py', '.js', '.ts', '.java', '.cpp', '.h', '.hpp', '.c', '.cs', '.go', '.rs', '.swift'}
+    exclude_dirs = {"venv", ".git", "__pycache__", "node_modules", ".mypy_cache", ".pytest_cache"}
+    exclude_files = {".DS_Store", "*.egg-info", "*.pyc", "*.pyo"}
+
+    for root, dirs, files in os.walk(path):
+        dirs[:] = [d for d in dirs if d not in exclude_dirs]
+        for file in files:
+            file_path = Path(root) / file
+            if file in exclude_files or any(file_path.match(pattern) for pattern in exclude_files):
+                continue
+            if file_path.suffix in extensions:
+                try:
+                    with open(file_path, 'r', encoding='utf-8') as f:
+                        content = f.read()
+                    files_to_analyze.append({
+                        "path": str(file_path.relative_to(path)),
+                        "content": content,
+                        "type": file_path.suffix[1:],
+                        "size": os.path.getsize(file_path)
+                    })
+                except Exception:
+                    pass
+    return files_to_analyze
+
+
+def _by_path(files):
+    return {file_info["path"].replace(os.sep, "/"): file_info for file_info in files}
+
+
+@pytest.fixture
+def fixture_tree(tmp_path):
+    """A tree exercising everything the scanner rewrites changed: hidden files, symlinks,
+    excluded directories, undecodable and large files, and a .clausiignore."""
+    root = tmp_path / "tree"
+    (root / ".git").mkdir(parents=True)
+    _write(root / "main.py", "print('hi')\n")
+    _write(root / "pkg" / "util.ts", "export const a = 1;\r\nexport const b = 2;\r\n")
+    _write(root / "pkg" / "deep" / "mod.rs", "fn main() {}\n")
+    _write(root / "pkg" / "notes.txt", "not source\n")
+    _write(root / "pkg" / "compiled.pyc", "")
+    _write(root / ".hidden" / "secret.py", "token = 1\n")
+    _write(root / ".env.py", "DEBUG = True\n")
+    # Names that are only an extension have no suffix and are not source files
+    _write(root / ".py", "not_source = 1\n")
+    _write(root / "pkg" / ".js", "notSource();\n")
+    _write(root / "pkg" / "..py", "source = 1\n")
+    _write(root / "node_modules" / "dep" / "index.js", "module.exports = {};\n")
+    _write(root / "__pycache__" / "main.py", "stale = 1\n")
+    _write(root / "generated" / "schema.py", "SCHEMA = {}\n")
+    # Above the mmap threshold, with CRLF line endings that text-mode reads translate
+    _write(root / "big.c", "int x;\r\n" * (scanner.MMAP_THRESHOLD // 4))
+    (root / "latin1.py").write_bytes(b"name = '\xe9'\n")
+    (root / ".clausiignore").write_text("generated/\n", encoding="utf-8")
+
+    if hasattr(os, "symlink"):
+        try:
+            os.symlink(root / "main.py", root / "pkg" / "linked.py")
+            os.symlink(root / "pkg" / "deep", root / "deep_link", target_is_directory=True)
+        except OSError:
+            pass
+    return root
+
+
+@pytest.fixture(params=["default", "scandir"])
+def walker(request, monkeypatch):
+    """Run a test with the platform's default walker and with the portable scandir fallback."""
+    if request.param == "scandir":
+        monkeypatch.delattr(os, "fwalk", raising=False)
+        monkeypatch.setattr(scanner.darwin_walk, "available", lambda: False)
+    return request.param
+
+
+def test_scan_directory_matches_baseline(fixture_tree, walker):
+    expected = _by_path(_baseline_scan_directory(fixture_tree))
+    errors = []
+
+    actual = _by_path(scanner.scan_directory(str(fixture_tree), errors=errors,
+                                             include_hidden=True, max_file_bytes=None))
+
+    assert sorted(actual) == sorted(expected)
+    for rel_path, file_info in expected.items():
+        assert actual[rel_path] == file_info, rel_path
+    # The undecodable file is reported instead of being dropped silently
+    assert [os.path.basename(path) for path, _ in errors] == ["latin1.py"]
+
+
+def test_scan_directory_differs_from_baseline_only_where_intended(fixture_tree, walker):
+    expected = _by_path(_baseline_scan_directory(fixture_tree))
+    big_size = expected["big.c"]["size"]
+
+    actual = _by_path(scanner.scan_directory(str(fixture_tree), errors=[], max_file_bytes=big_size - 1))
+
+    # Hidden directories are skipped by default; hidden files are not
+    assert ".hidden/secret.py" in expected
+    assert ".hidden/secret.py" not in actual
+    assert ".env.py" in actual
+    # Files over the size limit are listed without their content
+    assert actual["big.c"] == {"path": "big.c", "content": "", "type": "c", "size": big_size, "too_large": True}
+    # Everything else is unchanged
+    del expected[".hidden/secret.py"], expected["big.c"], actual["big.c"]
+    assert actual == expected
+
+
+@pytest.mark.skipif(scanner.pathspec is None, reason="needs pathspec")
+def test_clausiignore_filters_scanned_files(fixture_tree):
+    files = scanner.scan_directory(str(fixture_tree), errors=[])
+    assert "generated/schema.py" in _by_path(files)
+
+    kept = scanner.filter_ignored_files(files, str(fixture_tree))
+
+    assert sorted(_by_path(kept)) == sorted(set(_by_path(files)) - {"generated/schema.py"})
+
+
+@pytest.mark.skipif(scanner.resource is None, reason="needs the resource module")
+def test_import_leaves_nofile_limit_alone():
+    code = (
+        "import os, resource\n"
+        "resource.setrlimit(resource.RLIMIT_NOFILE, (256, resource.getrlimit(resource.RLIMIT_NOFILE)[1]))\n"
+        "fds = len(os.listdir('/proc/self/fd' if os.path.isdir('/proc/self/fd') else '/dev/fd'))\n"
+        "import clausi.core.scanner\n"
+        "assert resource.getrlimit(resource.RLIMIT_NOFILE)[0] == 256\n"
+        "assert len(os.listdir('/proc/self/fd' if os.path.isdir('/proc/self/fd') else '/dev/fd')) == fds\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [os.getcwd(), os.environ.get("PYTHONPATH")])))
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
+
+
+@pytest.mark.skipif(scanner.resource is None, reason="needs the resource module")
+def test_first_scan_raises_nofile_limit_once(project, monkeypatch):
+    calls = []
+    monkeypatch.setattr(scanner, "_NOFILE_RAISED", False)
+    monkeypatch.setattr(scanner.resource, "setrlimit", lambda *args: calls.append(args))
+    monkeypatch.setattr(scanner.resource, "getrlimit", lambda which: (256, 8192))
+    fds = len(os.listdir("/dev/fd"))
+
+    scanner.scan_directory(str(project))
+    scanner.scan_directory(str(project))
+
+    assert calls == [(scanner.resource.RLIMIT_NOFILE, (scanner.NOFILE_TARGET, 8192))]
+    assert len(os.listdir("/dev/fd")) == fds